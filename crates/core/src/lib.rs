@@ -7,7 +7,7 @@ pub mod language;
 pub use object::{Object, ObjectSchema, ObjectId};
 pub use gen::{GenOpts, Layout, World, generate};
 pub use agent::Agent;
-pub use sim::{Simulator, MoveError};
+pub use sim::{Simulator, MoveError, SimState, ObjectState};
 
 // Cell type constants
 pub const WALL: i8 = -1;
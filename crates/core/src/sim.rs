@@ -1,5 +1,7 @@
-use crate::gen::World;
-use crate::object::{Object, ObjectId};
+use serde::{Deserialize, Serialize};
+
+use crate::gen::{Cell, Layout, World, ROOM_NAME_POOL};
+use crate::object::{Object, ObjectId, ObjectSchema};
 use crate::agent::Agent;
 
 /// Constants for door types
@@ -26,6 +28,45 @@ pub enum MoveError {
     InvalidTarget,
 }
 
+/// Serializable form of an object; names are owned so they survive a round trip
+#[derive(Debug, Clone, Serialize, Deserialize)]
+pub struct ObjectState {
+    pub id: ObjectId,
+    pub name: String,
+    pub capacity: usize,
+    pub pickable: bool,
+    pub x: usize,
+    pub y: usize,
+    pub contents: Vec<ObjectId>,
+}
+
+impl From<&Object> for ObjectState {
+    fn from(obj: &Object) -> Self {
+        ObjectState {
+            id: obj.id,
+            name: obj.name.to_string(),
+            capacity: obj.capacity,
+            pickable: obj.pickable,
+            x: obj.x,
+            y: obj.y,
+            contents: obj.contents.clone(),
+        }
+    }
+}
+
+/// Serializable snapshot of a simulator: layout, objects, agent and held object
+#[derive(Debug, Clone, Serialize, Deserialize)]
+pub struct SimState {
+    pub width: usize,
+    pub height: usize,
+    pub cells: Vec<Cell>,
+    pub room_names: Vec<String>,
+    pub objects: Vec<ObjectState>,
+    pub holding: Option<ObjectState>,
+    pub agent_x: usize,
+    pub agent_y: usize,
+}
+
 /// Simulator state pairing a world with an agent and optional held object
 #[derive(Debug)]
 pub struct Simulator {
@@ -54,6 +95,73 @@ impl Simulator {
         Ok(Simulator { world, agent, holding: None })
     }
 
+    /// Capture the full simulator state
+    pub fn snapshot(&self) -> SimState {
+        let layout = &self.world.layout;
+        SimState {
+            width: layout.width,
+            height: layout.height,
+            cells: layout.cells.clone(),
+            room_names: layout.room_names.iter().map(|n| n.to_string()).collect(),
+            objects: self.world.objects.iter().map(ObjectState::from).collect(),
+            holding: self.holding.as_ref().map(ObjectState::from),
+            agent_x: self.agent.x,
+            agent_y: self.agent.y,
+        }
+    }
+
+    /// Rebuild a simulator from a snapshot without re-running world generation
+    pub fn restore(state: SimState) -> Result<Self, String> {
+        if state.cells.len() != state.width * state.height {
+            return Err("Layout cells length does not match dimensions".to_string());
+        }
+        // the agent may stand on an open door, so only bounds are checked here
+        if state.agent_x >= state.width || state.agent_y >= state.height {
+            return Err("Agent position out of bounds".to_string());
+        }
+        // names and descriptions are static; resolve them from the generator tables
+        let room_names = state
+            .room_names
+            .iter()
+            .map(|name| {
+                ROOM_NAME_POOL
+                    .iter()
+                    .copied()
+                    .find(|known| *known == name.as_str())
+                    .ok_or_else(|| format!("Unknown room name: {}", name))
+            })
+            .collect::<Result<Vec<_>, _>>()?;
+        let schemas = ObjectSchema::default_schemas();
+        let to_object = |obj: ObjectState| -> Result<Object, String> {
+            let schema = schemas
+                .iter()
+                .find(|s| s.name == obj.name)
+                .ok_or_else(|| format!("Unknown object name: {}", obj.name))?;
+            Ok(Object {
+                id: obj.id,
+                name: schema.name,
+                capacity: obj.capacity,
+                pickable: obj.pickable,
+                x: obj.x,
+                y: obj.y,
+                contents: obj.contents,
+                description: schema.description,
+            })
+        };
+        let objects = state
+            .objects
+            .into_iter()
+            .map(&to_object)
+            .collect::<Result<Vec<_>, _>>()?;
+        let holding = state.holding.map(&to_object).transpose()?;
+        let layout = Layout::new(state.width, state.height, state.cells, room_names);
+        Ok(Simulator {
+            world: World { layout, objects },
+            agent: Agent::new(state.agent_x, state.agent_y),
+            holding,
+        })
+    }
+
     /// Move agent up
     pub fn up(&mut self) -> Result<(), MoveError> {
         self.try_move(0, -1)
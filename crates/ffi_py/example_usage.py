@@ -56,8 +56,7 @@ def main():
             print(f"  {obj}")
             
         # Try to pick up a pickable object
-        pickable = [obj for obj in objects_here if obj.pickable]
-        if pickable:
+        if any(obj.pickable for obj in objects_here):
             try:
                 sim.pick_up()
                 holding = sim.get_holding()
@@ -1,5 +1,6 @@
 use pyo3::prelude::*;
 use pyo3::exceptions::{PyRuntimeError, PyValueError};
+use pyo3::types::PyBytes;
 use tidy_core;
 
 /// Python wrapper for GenOpts
@@ -159,10 +160,53 @@ impl From<&tidy_core::Layout> for PyLayout {
     }
 }
 
+/// `((x, y), position in world.objects)` pairs sorted by cell.
+///
+/// The index is rebuilt after every action that can move objects, so it is
+/// kept as one flat Vec: rebuilding reuses its allocation and a single sort,
+/// with no hashing or per-cell lists, and a lookup is a binary search for
+/// the run of one cell.
+type CellIndex = Vec<((usize, usize), usize)>;
+
 /// Python wrapper for Simulator
 #[pyclass]
 pub struct PySimulator {
     sim: tidy_core::Simulator,
+    cell_index: CellIndex,
+}
+
+impl PySimulator {
+    fn wrap(sim: tidy_core::Simulator) -> Self {
+        let mut wrapped = PySimulator { sim, cell_index: CellIndex::new() };
+        wrapped.rebuild_cell_index();
+        wrapped
+    }
+
+    /// Re-index objects by cell; called after every action that can move,
+    /// add or remove objects
+    fn rebuild_cell_index(&mut self) {
+        self.cell_index.clear();
+        self.cell_index.extend(
+            self.sim
+                .world
+                .objects
+                .iter()
+                .enumerate()
+                .map(|(i, obj)| ((obj.x, obj.y), i)),
+        );
+        // drop and place_into stack several objects on one cell; the
+        // position breaks those ties, so each run keeps world.objects order
+        self.cell_index.sort_unstable();
+    }
+
+    /// Objects at a cell in `world.objects` order, via the cell index
+    fn objects_at(&self, x: usize, y: usize) -> impl Iterator<Item = &tidy_core::Object> + '_ {
+        let start = self.cell_index.partition_point(|&(cell, _)| cell < (x, y));
+        self.cell_index[start..]
+            .iter()
+            .take_while(move |&&(cell, _)| cell == (x, y))
+            .map(move |&(_, i)| &self.sim.world.objects[i])
+    }
 }
 
 #[pymethods]
@@ -184,7 +228,7 @@ impl PySimulator {
         }
         
         match tidy_core::Simulator::new(world, start_x, start_y) {
-            Ok(sim) => Ok(PySimulator { sim }),
+            Ok(sim) => Ok(PySimulator::wrap(sim)),
             Err(e) => Err(PyRuntimeError::new_err(e)),
         }
     }
@@ -195,11 +239,29 @@ impl PySimulator {
         let world = tidy_core::generate(&rust_opts);
         
         match tidy_core::Simulator::new(world, start_x, start_y) {
-            Ok(sim) => Ok(PySimulator { sim }),
+            Ok(sim) => Ok(PySimulator::wrap(sim)),
             Err(e) => Err(PyRuntimeError::new_err(e)),
         }
     }
 
+    /// Rebuild a simulator from bytes produced by `get_state`, skipping world generation
+    #[staticmethod]
+    fn from_state(state: &[u8]) -> PyResult<Self> {
+        let state: tidy_core::SimState =
+            serde_json::from_slice(state).map_err(|e| PyValueError::new_err(e.to_string()))?;
+        match tidy_core::Simulator::restore(state) {
+            Ok(sim) => Ok(PySimulator::wrap(sim)),
+            Err(e) => Err(PyValueError::new_err(e)),
+        }
+    }
+
+    /// Serialize the full simulator state (layout, objects, agent, held object)
+    fn get_state<'py>(&self, py: Python<'py>) -> PyResult<&'py PyBytes> {
+        let bytes = serde_json::to_vec(&self.sim.snapshot())
+            .map_err(|e| PyRuntimeError::new_err(e.to_string()))?;
+        Ok(PyBytes::new(py, &bytes))
+    }
+
     #[getter]
     fn agent_x(&self) -> usize {
         self.sim.agent.x
@@ -229,7 +291,9 @@ impl PySimulator {
     fn interact(&mut self, dx: i32, dy: i32) -> PyResult<()> {
         self.sim
             .interact(dx as isize, dy as isize)
-            .map_err(|e| PyRuntimeError::new_err(e))
+            .map_err(|e| PyRuntimeError::new_err(e))?;
+        self.rebuild_cell_index();
+        Ok(())
     }
 
     fn open_door_up(&mut self) -> PyResult<()> {
@@ -249,17 +313,23 @@ impl PySimulator {
     }
 
     fn pick_up(&mut self) -> PyResult<()> {
-        self.sim.pick_up().map_err(|e| PyRuntimeError::new_err(format!("{:?}", e)))
+        self.sim.pick_up().map_err(|e| PyRuntimeError::new_err(format!("{:?}", e)))?;
+        self.rebuild_cell_index();
+        Ok(())
     }
 
     fn drop(&mut self) -> PyResult<()> {
-        self.sim.drop().map_err(|e| PyRuntimeError::new_err(format!("{:?}", e)))
+        self.sim.drop().map_err(|e| PyRuntimeError::new_err(format!("{:?}", e)))?;
+        self.rebuild_cell_index();
+        Ok(())
     }
 
     fn place_into(&mut self, target_id: usize) -> PyResult<()> {
         self.sim
             .place_into(target_id)
-            .map_err(|e| PyRuntimeError::new_err(format!("{:?}", e)))
+            .map_err(|e| PyRuntimeError::new_err(format!("{:?}", e)))?;
+        self.rebuild_cell_index();
+        Ok(())
     }
 
     fn get_layout(&self) -> PyLayout {
@@ -275,12 +345,19 @@ impl PySimulator {
     }
 
     fn get_objects_at(&self, x: usize, y: usize) -> Vec<PyObject> {
-        self.sim
-            .world
-            .objects
+        self.objects_at(x, y).map(PyObject::from).collect()
+    }
+
+    /// Ids of the objects at a cell, without building full `PyObject` wrappers
+    fn get_object_ids_at(&self, x: usize, y: usize) -> Vec<usize> {
+        self.objects_at(x, y).map(|obj| obj.id).collect()
+    }
+
+    /// Batched `get_objects_at`: one FFI call for several cells, results in input order
+    fn get_objects_at_many(&self, positions: Vec<(usize, usize)>) -> Vec<Vec<PyObject>> {
+        positions
             .iter()
-            .filter(|obj| obj.x == x && obj.y == y)
-            .map(PyObject::from)
+            .map(|&(x, y)| self.get_objects_at(x, y))
             .collect()
     }
 
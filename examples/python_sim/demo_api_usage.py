@@ -13,20 +13,14 @@ print(f"  Start: {challenge.start}")
 print(f"  Target: {challenge.target} ({challenge.target_object_name})")
 print(f"  Optimal path (arrows): {challenge.optimal_path_arrows}")
 
-# Try the optimal path
-result = env.reward(challenge.optimal_path_arrows)
-print("\nReward for optimal path:")
-print(result)
-
-# Try a suboptimal path (add some wasteful moves)
+# Evaluate the optimal path, a suboptimal one (extra wasteful moves) and an
+# invalid one (walking into a wall) in one batch
+paths = [("optimal", challenge.optimal_path_arrows)]
 if len(challenge.optimal_path_arrows) > 0:
-    suboptimal = challenge.optimal_path_arrows + "→→←←"
-    result2 = env.reward(suboptimal)
-    print("\nReward for suboptimal path:")
-    print(result2)
+    paths.append(("suboptimal", challenge.optimal_path_arrows + "→→←←"))
+paths.append(("invalid", "↑↑↑↑↑↑↑↑↑↑"))
 
-# Try an invalid path (walk into a wall)
-invalid = "↑↑↑↑↑↑↑↑↑↑"
-result3 = env.reward(invalid)
-print("\nReward for invalid path:")
-print(result3)
+rewards = env.reward_batch([path for _, path in paths])
+for (label, _), result in zip(paths, rewards):
+    print(f"\nReward for {label} path:")
+    print(result)
@@ -0,0 +1,39 @@
+"""
+Map Glyphs
+
+Display-only helpers shared by the text front ends: the glyph shown for each
+cell value and a renderer that turns a layout's flat cell list into rows of
+glyphs. Kept apart from the pathfinding code so the simulators can draw maps
+without importing it.
+
+Usage:
+    from glyphs import render_glyph_rows
+
+    rows = render_glyph_rows(layout.cells, layout.width, layout.height)
+"""
+
+import array
+from typing import List
+
+from tidy_env_py import constants
+
+# Display glyph per non-room cell value; every room id renders as floor
+CELL_GLYPHS = {
+    constants.WALL: '█',
+    constants.OUTSIDE: ' ',
+    constants.CLOSED_DOOR: '+',
+    constants.OPEN_DOOR: '-',
+}
+FLOOR_GLYPH = '·'
+
+# str.translate table over cell values packed as signed bytes: room ids
+# (0..127) map to floor, the negative cell types wrap to 252..255
+CELL_TRANSLATION = {room: FLOOR_GLYPH for room in range(128)}
+CELL_TRANSLATION.update({cell & 0xFF: glyph for cell, glyph in CELL_GLYPHS.items()})
+
+
+def render_glyph_rows(cells: List[int], width: int, height: int) -> List[str]:
+    """Render a flat cell list into one glyph string per row."""
+    packed = array.array('b', cells).tobytes().decode('latin-1')
+    grid = packed.translate(CELL_TRANSLATION)
+    return [grid[y * width:(y + 1) * width] for y in range(height)]
@@ -18,8 +18,11 @@ Commands:
 
 import sys
 import argparse
+import asyncio
 import os
-from typing import Optional, List, Tuple
+import threading
+from collections import defaultdict
+from typing import DefaultDict, Dict, Optional, Tuple
 
 # Try to import tidy_env_py directly (if installed in venv)
 try:
@@ -40,84 +43,190 @@ except ImportError:
         print(f"Import error: {e}")
         sys.exit(1)
 
+from glyphs import render_glyph_rows
+
+
+# (dx, dy, name) of the four cardinal neighbours
+DIRECTIONS: Tuple[Tuple[int, int, str], ...] = (
+    (0, -1, "north"),
+    (0, 1, "south"),
+    (-1, 0, "west"),
+    (1, 0, "east"),
+)
+
+# Door command -> (dx, dy, name)
+DOOR_DIRECTIONS: Dict[str, Tuple[int, int, str]] = {
+    'W': (0, -1, "north"),
+    'S': (0, 1, "south"),
+    'A': (-1, 0, "west"),
+    'D': (1, 0, "east"),
+}
+
+RULE = "=" * 50
+
+HELP_TEXT = f"""
+{RULE}
+HELP - Interactive Apartment Simulator
+{RULE}
+MOVEMENT:
+  w - Move up (north)
+  s - Move down (south)
+  a - Move left (west)
+  d - Move right (east)
+
+DOOR INTERACTION:
+  W - Open/close door to the north
+  S - Open/close door to the south
+  A - Open/close door to the west
+  D - Open/close door to the east
+
+OBJECT INTERACTION:
+  p - Pick up object at current location
+  r - Drop held object
+  i - Place held object into container
+
+INFORMATION:
+  l - Look around current location
+  m - Show map
+  o - List all objects
+  h - Show this help
+
+GAME:
+  q - Quit
+{RULE}
+"""
+
+MAP_HEADER = f"""
+{RULE}
+MAP (@ = you, · = floor, █ = wall, + = closed door, - = open door)
+    . = small object, # = furniture
+{RULE}"""
+
+# Default half-width of the map window around the agent
+MAP_RADIUS = 5
+
+
+async def ainput(prompt: str = "") -> str:
+    """Read a line of input without blocking the event loop.
+    
+    input() runs on a daemon thread rather than the default executor so an
+    interrupted program can exit while the read is still blocked.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def deliver(setter, value) -> None:
+        if not future.done():
+            setter(value)
+    
+    def read() -> None:
+        try:
+            line = input(prompt)
+        except BaseException as e:  # EOFError must reach the awaiting coroutine
+            loop.call_soon_threadsafe(deliver, future.set_exception, e)
+        else:
+            loop.call_soon_threadsafe(deliver, future.set_result, line)
+    
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
 
 class InteractiveSimulator:
     def __init__(self, opts: tidy_env_py.PyGenOpts):
         """Initialize the interactive simulator."""
         self.sim = tidy_env_py.PySimulator(opts)
-        self.layout = self.sim.get_layout()
+        self._refresh_layout()
+        self._width = self.layout.width
+        self._height = self.layout.height
+        
+        # pickable/capacity never change, so objects are classified by id as
+        # they are indexed
+        self._pickable_ids = set()
+        self._container_ids = set()
+        self._refresh_objects()
+        
+        # Snapshot of the held object, kept in sync by the action handlers
+        self._holding: Optional[tidy_env_py.PyObject] = None
+        
+        # Map frame composed while waiting for input; None once state changes
+        self._prefetched_map: Optional[str] = None
+        
         print(f"🏠 Welcome to the Apartment Simulator!")
         print(f"Generated apartment: {self.layout.width}x{self.layout.height} with {len(self.layout.room_names)} rooms")
         print(f"Total objects: {len(self.sim.get_objects())}")
         print(f"Agent starting position: ({self.sim.agent_x}, {self.sim.agent_y})")
         print("\nType 'h' for help or 'q' to quit.")
-        
-    def get_cell_char(self, x: int, y: int) -> str:
-        """Get the character representation of a cell."""
-        if x >= self.layout.width or y >= self.layout.height:
-            return ' '
-            
-        cell_value = self.layout.get_cell(x, y)
-        
-        # Check if agent is at this position
-        if x == self.sim.agent_x and y == self.sim.agent_y:
-            return '@'
-            
-        # Check for objects at this position
+
+    def _refresh_layout(self) -> None:
+        """Snapshot the cell grid with one FFI call (doors change it in place)."""
+        self.layout = self.sim.get_layout()
+        self._cells = self.layout.cells
+        self._glyph_rows = render_glyph_rows(self._cells, self.layout.width, self.layout.height)
+
+    def _refresh_objects(self) -> None:
+        """Rebuild the (x, y) -> objects index from a single get_objects() sweep."""
+        objects_by_cell: Dict[Tuple[int, int], list] = {}
+        for obj in self.sim.get_objects():
+            objects_by_cell.setdefault((obj.x, obj.y), []).append(obj)
+            if obj.pickable:
+                self._pickable_ids.add(obj.id)
+            if obj.capacity > 0:
+                self._container_ids.add(obj.id)
+        self._objects_by_cell = objects_by_cell
+        self._containers_by_cell: Dict[Tuple[int, int], list] = {}
+        for cell in objects_by_cell:
+            self._index_cell_containers(cell)
+
+    def _index_cell_containers(self, cell: Tuple[int, int]) -> None:
+        """Update the containers index of one cell from its objects."""
+        containers = [obj for obj in self._objects_by_cell.get(cell, ()) if obj.id in self._container_ids]
+        if containers:
+            self._containers_by_cell[cell] = containers
+        else:
+            self._containers_by_cell.pop(cell, None)
+
+    def _refresh_cell_objects(self, x: int, y: int) -> None:
+        """Re-fetch the objects of a single cell after it was mutated."""
         objects_here = self.sim.get_objects_at(x, y)
         if objects_here:
-            # Show the first object's symbol
-            obj = objects_here[0]
-            if obj.pickable:
-                return '.'  # Small pickable items
-            else:
-                return '#'  # Large objects/furniture
+            self._objects_by_cell[(x, y)] = objects_here
+        else:
+            self._objects_by_cell.pop((x, y), None)
+        self._index_cell_containers((x, y))
         
-        # Show cell type
-        if cell_value == constants.WALL:
-            return '█'
-        elif cell_value == constants.OUTSIDE:
-            return ' '
-        elif cell_value == constants.CLOSED_DOOR:
-            return '+'
-        elif cell_value == constants.OPEN_DOOR:
-            return '-'
+    def show_map(self, radius: int = MAP_RADIUS) -> None:
+        """Display a map around the agent."""
+        if radius == MAP_RADIUS and self._prefetched_map is not None:
+            sys.stdout.write(self._prefetched_map)
         else:
-            # Room cell
-            return '·'
+            sys.stdout.write(self._render_map(radius))
     
-    def show_map(self, radius: int = 5) -> None:
-        """Display a map around the agent."""
+    def _render_map(self, radius: int = MAP_RADIUS) -> str:
+        """Compose the map window around the agent as one string."""
         agent_x, agent_y = self.sim.agent_x, self.sim.agent_y
         
-        print("\n" + "="*50)
-        print("MAP (@ = you, · = floor, █ = wall, + = closed door, - = open door)")
-        print("    . = small object, # = furniture")
-        print("="*50)
-        
         # Show a window around the agent
         start_x = max(0, agent_x - radius)
         end_x = min(self.layout.width, agent_x + radius + 1)
         start_y = max(0, agent_y - radius)
         end_y = min(self.layout.height, agent_y + radius + 1)
         
-        # Print column numbers
-        print("   ", end="")
-        for x in range(start_x, end_x):
-            print(f"{x%10}", end="")
-        print()
+        # Column numbers above and below the map
+        header = "   " + "".join(str(x % 10) for x in range(start_x, end_x))
+        
+        lines = [MAP_HEADER, header]
+        # Slice the cached glyph rows, then overlay objects and the agent
+        grid = [list(self._glyph_rows[y][start_x:end_x]) for y in range(start_y, end_y)]
+        for (obj_x, obj_y), objects_here in self._objects_by_cell.items():
+            if start_x <= obj_x < end_x and start_y <= obj_y < end_y:
+                grid[obj_y - start_y][obj_x - start_x] = '.' if objects_here[0].pickable else '#'
+        grid[agent_y - start_y][agent_x - start_x] = '@'
         
-        for y in range(start_y, end_y):
-            print(f"{y:2} ", end="")
-            for x in range(start_x, end_x):
-                print(self.get_cell_char(x, y), end="")
-            print(f" {y}")
+        for y, row in enumerate(grid, start_y):
+            lines.append(f"{y:2} {''.join(row)} {y}")
+        lines.append(header)
         
-        # Print column numbers again
-        print("   ", end="")
-        for x in range(start_x, end_x):
-            print(f"{x%10}", end="")
-        print()
+        return "\n".join(lines) + "\n"
     
     def look_around(self) -> None:
         """Look around the current position."""
@@ -142,36 +251,33 @@ class InteractiveSimulator:
             print("🔍 No objects here.")
         
         # Show what you're holding
-        holding = self.sim.get_holding()
-        if holding:
-            print(f"🤏 Holding: {holding.name}")
+        if self._holding:
+            print(f"🤏 Holding: {self._holding.name}")
         else:
             print("🤏 Hands are empty.")
         
         # Check adjacent cells for doors or objects
-        directions = [
-            (0, -1, "north"),
-            (0, 1, "south"), 
-            (-1, 0, "west"),
-            (1, 0, "east")
+        # Fetch the objects of all in-bounds neighbours in one FFI call
+        neighbours = [
+            (x + dx, y + dy, direction)
+            for dx, dy, direction in DIRECTIONS
+            if 0 <= x + dx < self._width and 0 <= y + dy < self._height
         ]
+        neighbour_objects = self.sim.get_objects_at_many([(adj_x, adj_y) for adj_x, adj_y, _ in neighbours])
         
         adjacent_info = []
-        for dx, dy, direction in directions:
-            adj_x, adj_y = x + dx, y + dy
-            if 0 <= adj_x < self.layout.width and 0 <= adj_y < self.layout.height:
-                adj_cell = self.layout.get_cell(adj_x, adj_y)
-                if adj_cell == constants.CLOSED_DOOR:
-                    adjacent_info.append(f"🚪 Closed door to {direction}")
-                elif adj_cell == constants.OPEN_DOOR:
-                    adjacent_info.append(f"🚪 Open door to {direction}")
-                
-                adj_objects = self.sim.get_objects_at(adj_x, adj_y)
-                if adj_objects:
-                    obj_names = [obj.name for obj in adj_objects[:2]]
-                    if len(adj_objects) > 2:
-                        obj_names.append("...")
-                    adjacent_info.append(f"🔍 {direction}: {', '.join(obj_names)}")
+        for (adj_x, adj_y, direction), adj_objects in zip(neighbours, neighbour_objects):
+            adj_cell = self._cells[adj_y * self._width + adj_x]
+            if adj_cell == constants.CLOSED_DOOR:
+                adjacent_info.append(f"🚪 Closed door to {direction}")
+            elif adj_cell == constants.OPEN_DOOR:
+                adjacent_info.append(f"🚪 Open door to {direction}")
+            
+            if adj_objects:
+                obj_names = [obj.name for obj in adj_objects[:2]]
+                if len(adj_objects) > 2:
+                    obj_names.append("...")
+                adjacent_info.append(f"🔍 {direction}: {', '.join(obj_names)}")
         
         if adjacent_info:
             print("🧭 Nearby:")
@@ -183,17 +289,15 @@ class InteractiveSimulator:
         objects = self.sim.get_objects()
         print(f"\n📋 All Objects ({len(objects)} total):")
         
-        # Group by room
-        rooms = {}
+        # Group by room; many objects share a room, so resolve each name once
+        room_names: Dict[int, str] = {}
+        rooms: DefaultDict[str, list] = defaultdict(list)
         for obj in objects:
-            cell_value = self.layout.get_cell(obj.x, obj.y)
-            if cell_value >= 0:
-                room_name = self.layout.get_room_name(cell_value)
-            else:
-                room_name = "Outside"
-            
-            if room_name not in rooms:
-                rooms[room_name] = []
+            cell_value = self._cells[obj.y * self._width + obj.x]
+            room_name = room_names.get(cell_value)
+            if room_name is None:
+                room_name = self.layout.get_room_name(cell_value) if cell_value >= 0 else "Outside"
+                room_names[cell_value] = room_name
             rooms[room_name].append(obj)
         
         for room_name, room_objects in rooms.items():
@@ -205,35 +309,7 @@ class InteractiveSimulator:
     
     def show_help(self) -> None:
         """Show help information."""
-        print("\n" + "="*50)
-        print("HELP - Interactive Apartment Simulator")
-        print("="*50)
-        print("MOVEMENT:")
-        print("  w - Move up (north)")
-        print("  s - Move down (south)")
-        print("  a - Move left (west)")
-        print("  d - Move right (east)")
-        print()
-        print("DOOR INTERACTION:")
-        print("  W - Open/close door to the north")
-        print("  S - Open/close door to the south")
-        print("  A - Open/close door to the west")
-        print("  D - Open/close door to the east")
-        print()
-        print("OBJECT INTERACTION:")
-        print("  p - Pick up object at current location")
-        print("  r - Drop held object")
-        print("  i - Place held object into container")
-        print()
-        print("INFORMATION:")
-        print("  l - Look around current location")
-        print("  m - Show map")
-        print("  o - List all objects")
-        print("  h - Show this help")
-        print()
-        print("GAME:")
-        print("  q - Quit")
-        print("="*50)
+        sys.stdout.write(HELP_TEXT)
     
     def handle_move(self, direction: str) -> bool:
         """Handle movement commands. Returns True if successful."""
@@ -257,20 +333,17 @@ class InteractiveSimulator:
     
     def handle_door(self, direction: str) -> bool:
         """Handle door interaction commands."""
-        direction_map = {
-            'W': (0, -1, "north"),
-            'S': (0, 1, "south"),
-            'A': (-1, 0, "west"),
-            'D': (1, 0, "east")
-        }
-        
-        if direction not in direction_map:
+        if direction not in DOOR_DIRECTIONS:
             return False
         
-        dx, dy, dir_name = direction_map[direction]
+        dx, dy, dir_name = DOOR_DIRECTIONS[direction]
         
         try:
             self.sim.interact(dx, dy)
+            # interact() may also toggle doors or move objects on the target cell
+            self._refresh_layout()
+            self._refresh_objects()
+            self._holding = self.sim.get_holding()
             print(f"🚪 Interacted with door to the {dir_name}")
             return True
         except RuntimeError as e:
@@ -279,17 +352,23 @@ class InteractiveSimulator:
     
     def handle_pickup(self) -> bool:
         """Handle pickup command."""
-        objects_here = self.sim.get_objects_at(self.sim.agent_x, self.sim.agent_y)
-        pickable_objects = [obj for obj in objects_here if obj.pickable]
+        ids_here = self.sim.get_object_ids_at(self.sim.agent_x, self.sim.agent_y)
         
-        if not pickable_objects:
+        if self._pickable_ids.isdisjoint(ids_here):
             print("❌ No pickable objects here.")
             return False
         
         try:
             self.sim.pick_up()
-            holding = self.sim.get_holding()
+            holding = self._holding = self.sim.get_holding()
             if holding:
+                cell = (self.sim.agent_x, self.sim.agent_y)
+                remaining = [obj for obj in self._objects_by_cell.get(cell, []) if obj.id != holding.id]
+                if remaining:
+                    self._objects_by_cell[cell] = remaining
+                else:
+                    self._objects_by_cell.pop(cell, None)
+                self._index_cell_containers(cell)
                 print(f"✅ Picked up: {holding.name}")
             return True
         except RuntimeError as e:
@@ -298,13 +377,17 @@ class InteractiveSimulator:
     
     def handle_drop(self) -> bool:
         """Handle drop command."""
-        holding = self.sim.get_holding()
+        holding = self._holding
         if not holding:
             print("❌ Not holding anything.")
             return False
         
         try:
             self.sim.drop()
+            self._holding = None
+            holding.x, holding.y = self.sim.agent_x, self.sim.agent_y
+            self._objects_by_cell.setdefault((holding.x, holding.y), []).append(holding)
+            self._index_cell_containers((holding.x, holding.y))
             print(f"✅ Dropped: {holding.name}")
             return True
         except RuntimeError as e:
@@ -313,13 +396,13 @@ class InteractiveSimulator:
     
     def handle_place_into(self) -> bool:
         """Handle placing object into container."""
-        holding = self.sim.get_holding()
+        holding = self._holding
         if not holding:
             print("❌ Not holding anything to place.")
             return False
         
-        objects_here = self.sim.get_objects_at(self.sim.agent_x, self.sim.agent_y)
-        containers = [obj for obj in objects_here if obj.capacity > 0 and obj.id != holding.id]
+        containers_here = self._containers_by_cell.get((self.sim.agent_x, self.sim.agent_y), ())
+        containers = [obj for obj in containers_here if obj.id != holding.id]
         
         if not containers:
             print("❌ No containers here.")
@@ -347,6 +430,9 @@ class InteractiveSimulator:
         
         try:
             self.sim.place_into(target.id)
+            self._holding = None
+            # The container's contents changed too, so re-fetch the whole cell
+            self._refresh_cell_objects(target.x, target.y)
             print(f"✅ Placed {holding.name} into {target.name}")
             return True
         except RuntimeError as e:
@@ -355,12 +441,27 @@ class InteractiveSimulator:
     
     def run(self) -> None:
         """Run the interactive simulation loop."""
+        try:
+            asyncio.run(self._run_async())
+        except KeyboardInterrupt:
+            print("\n👋 Goodbye!")
+    
+    async def _prefetch_view(self) -> None:
+        """Compose the next map frame while the user is typing."""
+        self._prefetched_map = self._render_map()
+    
+    async def _run_async(self) -> None:
+        """Command loop; the map frame is prefetched during each input wait."""
         self.show_map()
         self.look_around()
         
         while True:
             try:
-                command = input("\n🎮 Command: ").strip()
+                # The previous command may have changed the state
+                self._prefetched_map = None
+                prefetch = asyncio.create_task(self._prefetch_view())
+                command = (await ainput("\n🎮 Command: ")).strip()
+                await prefetch
                 
                 if not command:
                     continue
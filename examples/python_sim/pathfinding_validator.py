@@ -28,9 +28,11 @@ Usage:
 
 import sys
 import os
-import heapq
+import array
+import itertools
 import random
-from typing import List, Tuple, Optional, NamedTuple, Set
+from collections import OrderedDict
+from typing import Dict, List, Tuple, Optional, NamedTuple, Sequence, Set
 from dataclasses import dataclass
 from enum import Enum
 
@@ -38,6 +40,90 @@ from enum import Enum
 import tidy_env_py
 from tidy_env_py import constants
 
+# Optional: compile the grid search with numba when it is installed
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _astar_parents(walk, column, start, goal):
+        """A* over the padded column-major walk mask used by PathfindingValidator.
+        
+        The open set is a binary heap in a preallocated int64 array; each
+        entry packs (f, g, index) into one integer so ties break exactly as
+        in the Python search. Returns the parent index of every reached
+        cell, -1 for unreached cells; the start cell is its own parent.
+        """
+        size = walk.shape[0]
+        goal_x = goal // column
+        goal_y = goal % column
+        g_score = np.full(size, size, dtype=np.int64)
+        parent = np.full(size, -1, dtype=np.int64)
+        closed = np.zeros(size, dtype=np.uint8)
+        # Every push follows a strict g improvement, at most 4 per closed cell
+        heap = np.empty(4 * size + 1, dtype=np.int64)
+        
+        g_score[start] = 0
+        parent[start] = start
+        h = abs(start // column - goal_x) + abs(start % column - goal_y)
+        heap[0] = h * size * size + start
+        count = 1
+        while count > 0:
+            key = heap[0]
+            count -= 1
+            last = heap[count]
+            i = 0
+            while True:
+                child = 2 * i + 1
+                if child >= count:
+                    break
+                if child + 1 < count and heap[child + 1] < heap[child]:
+                    child += 1
+                if heap[child] < last:
+                    heap[i] = heap[child]
+                    i = child
+                else:
+                    break
+            if count > 0:
+                heap[i] = last
+            
+            current = key % size
+            if closed[current]:
+                continue
+            closed[current] = 1
+            if current == goal:
+                break
+            
+            new_g = g_score[current] + 1
+            # _DIRS order (up, down, left, right) in column-major offsets
+            for offset in (-1, 1, -column, column):
+                neighbor = current + offset
+                if walk[neighbor] and new_g < g_score[neighbor]:
+                    g_score[neighbor] = new_g
+                    parent[neighbor] = current
+                    # Branchless |dx| + |dy|: x >> 63 is 0 or -1 for int64
+                    dx = neighbor // column - goal_x
+                    dy = neighbor % column - goal_y
+                    h = (dx ^ (dx >> 63)) - (dx >> 63) + (dy ^ (dy >> 63)) - (dy >> 63)
+                    item = ((new_g + h) * size + new_g) * size + neighbor
+                    i = count
+                    count += 1
+                    while i > 0:
+                        up = (i - 1) // 2
+                        if heap[up] > item:
+                            heap[i] = heap[up]
+                            i = up
+                        else:
+                            break
+                    heap[i] = item
+        return parent
+
+
 class Direction(Enum):
     """Cardinal directions for movement."""
     UP = (0, -1, "↑")
@@ -64,6 +150,110 @@ class Direction(Enum):
         return "".join(d.symbol for d in cls)
 
 
+# Plain-tuple copies of Direction for the hot loops (enum iteration and
+# attribute access are comparatively slow)
+_DIRS: Tuple[Tuple[int, int, str], ...] = tuple((d.dx, d.dy, d.symbol) for d in Direction)
+# Step symbol -> (dx, dy); arrow paths may also use the ASCII letters U/D/L/R
+_SYM_TABLE = {symbol: (dx, dy) for dx, dy, symbol in _DIRS}
+_SYM_TABLE.update({'U': (0, -1), 'D': (0, 1), 'L': (-1, 0), 'R': (1, 0)})
+_DELTA_TO_SYM = {(dx, dy): symbol for dx, dy, symbol in _DIRS}
+
+# ASCII layout glyphs as a str.translate table over cell values packed as
+# signed bytes: room ids (0..127) are '□', unknown negative values '?'
+LAYOUT_TRANSLATION = {value: '□' if value < 128 else '?' for value in range(256)}
+LAYOUT_TRANSLATION.update({
+    constants.WALL & 0xFF: '■',
+    constants.OUTSIDE & 0xFF: ' ',
+    constants.CLOSED_DOOR & 0xFF: 'D',
+    constants.OPEN_DOOR & 0xFF: 'd',
+})
+
+# Maximum number of (start, goal) searches remembered per validator
+ASTAR_CACHE_SIZE = 1024
+
+
+class _PairingHeap:
+    """Min pairing heap holding each item at most once, with decrease-key.
+    
+    Nodes are lists ``[key, item, child, next_sibling, prev]`` where ``prev``
+    is the parent for a first child and the left sibling otherwise.
+    """
+    __slots__ = ("_root", "_nodes")
+    
+    def __init__(self):
+        self._root = None
+        self._nodes = {}
+    
+    def __bool__(self) -> bool:
+        return self._root is not None
+    
+    def push(self, item, key) -> None:
+        """Insert item, or lower its key if it is already queued."""
+        node = self._nodes.get(item)
+        if node is None:
+            node = [key, item, None, None, None]
+            self._nodes[item] = node
+            self._root = node if self._root is None else self._meld(self._root, node)
+        elif key < node[0]:
+            node[0] = key
+            if node is not self._root:
+                self._cut(node)
+                self._root = self._meld(self._root, node)
+    
+    def pop(self):
+        """Remove and return ``(item, key)`` with the smallest key."""
+        root = self._root
+        del self._nodes[root[1]]
+        self._root = self._merge_pairs(root[2])
+        return root[1], root[0]
+    
+    @staticmethod
+    def _meld(a, b):
+        """Link two detached trees; the larger root becomes the first child."""
+        if b[0] < a[0]:
+            a, b = b, a
+        first_child = a[2]
+        b[3] = first_child
+        b[4] = a
+        if first_child is not None:
+            first_child[4] = b
+        a[2] = b
+        return a
+    
+    @staticmethod
+    def _cut(node) -> None:
+        """Detach node (with its subtree) from its parent's child list."""
+        prev, nxt = node[4], node[3]
+        if prev[2] is node:
+            prev[2] = nxt
+        else:
+            prev[3] = nxt
+        if nxt is not None:
+            nxt[4] = prev
+        node[3] = node[4] = None
+    
+    def _merge_pairs(self, first):
+        """Two-pass merge of a sibling list into a single tree."""
+        pairs = []
+        node = first
+        while node is not None:
+            a = node
+            b = a[3]
+            if b is None:
+                a[3] = a[4] = None
+                pairs.append(a)
+                break
+            node = b[3]
+            a[3] = a[4] = b[3] = b[4] = None
+            pairs.append(self._meld(a, b))
+        if not pairs:
+            return None
+        root = pairs.pop()
+        while pairs:
+            root = self._meld(pairs.pop(), root)
+        return root
+
+
 @dataclass
 class PathResult:
     """Result of path validation."""
@@ -77,15 +267,21 @@ class PathResult:
     error_message: Optional[str] = None
     efficiency: Optional[float] = None
     optimal_length: Optional[int] = None
+    # Optimal-path index of the last point after the start where path_taken
+    # crossed the optimal path (0 if never); set when validate_path gets opt_idx_of
+    last_optimal_index: int = 0
 
 
-@dataclass
-class NavigationChallenge:
-    """A navigation challenge with start, target, and optimal solution."""
+class NavigationChallenge(NamedTuple):
+    """A navigation challenge with start, target, and optimal solution.
+
+    Immutable and dict-free: instances are hashable (usable as cache keys)
+    and pickle cheaply across worker processes.
+    """
     start: Tuple[int, int]
     target: Tuple[int, int]
     target_object_name: str
-    optimal_path: List[Tuple[int, int]]
+    optimal_path: Tuple[Tuple[int, int], ...]
     optimal_path_length: int
     optimal_path_arrows: str
     description: str
@@ -97,29 +293,138 @@ class PathfindingValidator:
     def __init__(self, simulator: tidy_env_py.PySimulator):
         """Initialize with a simulator instance."""
         self.sim = simulator
-        self.layout = simulator.get_layout()
+        
+        # LRU of (start, goal, search name) -> (path, arrows, length) of a
+        # shortest path, all None when unreachable; see _optimal. Results stay
+        # valid for the current snapshot, until clear_cache() or refresh()
+        self._astar_cache: OrderedDict = OrderedDict()
+        
+        # (objects, ids of objects held inside containers), see _get_visible_objects
+        self._objects_cache: Optional[Tuple[list, Set[int]]] = None
+        
+        # Bumped whenever the snapshot changes; tags the cached ASCII render
+        self._version = 0
+        self._ascii_cache: Optional[Tuple[int, str]] = None
+        
+        self.refresh()
+    
+    def refresh(self) -> None:
+        """Re-snapshot the simulator after it has changed.
+        
+        The layout, walk masks and agent position are read here in a few bulk
+        FFI calls; the objects are fetched again on first use. Every query is
+        answered from this snapshot, so no hot loop crosses the FFI.
+        """
+        self.layout = self.sim.get_layout()
+        self._width = self.layout.width
+        self._height = self.layout.height
+        
+        # Row-major walkability masks (1 = walkable) from one bulk cell read,
+        # without and with closed doors counted as passable
+        self._cells = self.layout.cells
+        self._walk_open = bytearray(
+            cell >= 0 or cell == constants.OPEN_DOOR for cell in self._cells
+        )
+        self._walk_closed = bytearray(
+            walk or cell == constants.CLOSED_DOOR for walk, cell in zip(self._walk_open, self._cells)
+        )
+        
+        # The search mask (closed doors passable) with a one-cell unwalkable
+        # border, so flat-index neighbours never need bounds checks. It is
+        # column-major, (x + 1) * column + (y + 1), so heap ties on the index
+        # break the same way they would on (x, y) tuples.
+        column = self._height + 2
+        self._padded_column = column
+        self._walk_padded = bytearray(column * (self._width + 2))
+        for x in range(self._width):
+            start = (x + 1) * column + 1
+            self._walk_padded[start:start + self._height] = self._walk_closed[x::self._width]
+        # Flat-index offsets in _DIRS order (up, down, left, right)
+        self._padded_offsets = tuple(dx * column + dy for dx, dy, _ in _DIRS)
+        self._sym_to_offset = {symbol: dx * column + dy for symbol, (dx, dy) in _SYM_TABLE.items()}
+        
+        if NUMBA_AVAILABLE:
+            # The compiled search runs over the same padded mask
+            self._walk_array = np.frombuffer(bytes(self._walk_padded), dtype=np.uint8)
+        
+        self._agent_pos = (self.sim.agent_x, self.sim.agent_y)
+        self._astar_cache.clear()
+        self._objects_cache = None
+        self._version += 1
+    
+    def clear_cache(self) -> None:
+        """Forget memoized pathfinding results; use refresh() when the layout changed."""
+        self._astar_cache.clear()
+    
+    def invalidate_objects(self) -> None:
+        """Forget the objects snapshot (call after objects move in the simulator)."""
+        self._objects_cache = None
+        self._version += 1
+    
+    def _layout_grid(self) -> List[List[str]]:
+        """ASCII layout as mutable rows of glyphs, ready for object/agent overlays."""
+        packed = array.array('b', self._cells).tobytes().decode('latin-1')
+        glyphs = packed.translate(LAYOUT_TRANSLATION)
+        width = self._width
+        return [list(glyphs[y * width:(y + 1) * width]) for y in range(self._height)]
+    
+    def render_ascii(self) -> str:
+        """ASCII layout with object ids and the agent ('@'), one line per row.
+        
+        Cached until the snapshot changes (refresh() or invalidate_objects()).
+        """
+        if self._ascii_cache is not None and self._ascii_cache[0] == self._version:
+            return self._ascii_cache[1]
+        
+        width, height = self._width, self._height
+        grid = self._layout_grid()
+        
+        # Place objects with their IDs (avoiding contained objects)
+        objects, excluded_ids = self._get_visible_objects()
+        for obj in objects:
+            if obj.id not in excluded_ids and 0 <= obj.x < width and 0 <= obj.y < height:
+                grid[obj.y][obj.x] = str(obj.id)
+        
+        # Place agent as '@'
+        agent_x, agent_y = self._agent_pos
+        if 0 <= agent_x < width and 0 <= agent_y < height:
+            grid[agent_y][agent_x] = '@'
+        
+        ascii_layout = '\n'.join(''.join(row) for row in grid)
+        self._ascii_cache = (self._version, ascii_layout)
+        return ascii_layout
+    
+    def _get_visible_objects(self) -> Tuple[list, Set[int]]:
+        """Return all objects plus the ids of those stored inside containers.
+        
+        Fetched with one get_objects() call and memoized until invalidate_objects().
+        """
+        if self._objects_cache is None:
+            objects = self.sim.get_objects()
+            excluded_ids = set()
+            for obj in objects:
+                if hasattr(obj, 'contents'):
+                    excluded_ids.update(obj.contents)
+            self._objects_cache = (objects, excluded_ids)
+        return self._objects_cache
         
     def is_walkable(self, x: int, y: int, allow_closed_doors: bool = False) -> bool:
         """Check if a position is walkable (not wall or outside). Optionally allow closed doors."""
-        if x < 0 or x >= self.layout.width or y < 0 or y >= self.layout.height:
+        if x < 0 or x >= self._width or y < 0 or y >= self._height:
             return False
         
-        cell_value = self.layout.get_cell(x, y)
-        
-        if allow_closed_doors:
-            # Treat closed doors as walkable for pathfinding
-            return cell_value >= 0 or cell_value == constants.OPEN_DOOR or cell_value == constants.CLOSED_DOOR
-        else:
-            return cell_value >= 0 or cell_value == constants.OPEN_DOOR
+        # Treat closed doors as walkable for pathfinding when asked to
+        walk = self._walk_closed if allow_closed_doors else self._walk_open
+        return walk[y * self._width + x] == 1
 
     def get_neighbors(self, pos: Tuple[int, int], allow_closed_doors: bool = False) -> List[Tuple[int, int]]:
         """Get valid neighboring positions."""
         x, y = pos
         neighbors = []
         
-        for direction in Direction:
-            new_x = x + direction.dx
-            new_y = y + direction.dy
+        for dx, dy, _ in _DIRS:
+            new_x = x + dx
+            new_y = y + dy
             
             if self.is_walkable(new_x, new_y, allow_closed_doors=allow_closed_doors):
                 neighbors.append((new_x, new_y))
@@ -131,42 +436,232 @@ class PathfindingValidator:
         return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
     
     def find_path_astar(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
-        """Find optimal path using A* algorithm, treating closed doors as walkable."""
+        """Find optimal path using A* algorithm, treating closed doors as walkable.
+        
+        Results are memoized per (start, goal); each call returns a fresh list.
+        Paths memoized for other searches are never returned here.
+        """
+        path = self._optimal(start, goal)[0]
+        return list(path) if path is not None else None
+    
+    def _optimal(self, start: Tuple[int, int], goal: Tuple[int, int],
+                 search=None) -> Tuple[Optional[Tuple[Tuple[int, int], ...]], Optional[str], Optional[int]]:
+        """Memoized (path, arrows, length) of a shortest path, all None if unreachable.
+        
+        On a miss the path comes from search (default: the A* search) and its
+        arrows and step count are stored with it, so later callers needing
+        any of the three share one search and one arrow conversion. Entries
+        are kept per search, since equally short paths can differ between them.
+        """
+        search = search or self._search
+        key = (start, goal, search.__name__)
+        entry = self._astar_cache.get(key)
+        if entry is not None:
+            self._astar_cache.move_to_end(key)
+            return entry
+        
+        path = search(start, goal)
+        if path is None:
+            entry = (None, None, None)
+        else:
+            path = tuple(path)
+            entry = (path, self.path_to_arrows(path), len(path) - 1)
+        self._astar_cache[key] = entry
+        if len(self._astar_cache) > ASTAR_CACHE_SIZE:
+            self._astar_cache.popitem(last=False)
+        return entry
+    
+    def _optimal_length(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[int]:
+        """Length of a shortest path, None if unreachable.
+        
+        Every search here is exact, so a path memoized by any of them gives
+        the length; only when none has one does the A* search run.
+        """
+        for search in (self._search, self.find_path_bidirectional):
+            entry = self._astar_cache.get((start, goal, search.__name__))
+            if entry is not None:
+                return entry[2]
+        return self._optimal(start, goal)[2]
+    
+    def _search(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+        """Uncached shortest-path search behind find_path_astar."""
         if start == goal:
             return [start]
         
         if not self.is_walkable(goal[0], goal[1], allow_closed_doors=True):
             return None
+        if not (0 <= start[0] < self._width and 0 <= start[1] < self._height):
+            return None
         
-        # Priority queue: (f_score, g_score, position, path)
-        open_set = [(0, 0, start, [start])]
-        visited: Set[Tuple[int, int]] = set()
+        # The compiled heap packs (f, g, cell) into one int64 key, which
+        # only fits while the mask has fewer than 2**21 cells
+        if NUMBA_AVAILABLE and len(self._walk_padded) ** 3 < 2 ** 63:
+            return self._find_path_compiled(start, goal)
+        
+        # Search over flat indices into the padded mask
+        column = self._padded_column
+        walk = self._walk_padded
+        offsets = self._padded_offsets
+        start_idx = (start[0] + 1) * column + start[1] + 1
+        goal_idx = (goal[0] + 1) * column + goal[1] + 1
+        goal_x, goal_y = goal[0] + 1, goal[1] + 1
+        # Heuristic per node, computed inline (no method call) at most once
+        h_cache = {}
+        
+        # Per-index arrays instead of dicts; no g score exceeds the cell count
+        size = len(walk)
+        g_scores = [size] * size
+        g_scores[start_idx] = 0
+        came_from = [0] * size
+        
+        # Open set keyed by (f_score, g_score, index); an improved neighbour
+        # has its key decreased in place, so every node is queued at most once
+        # and, with a consistent heuristic, is final when popped
+        open_set = _PairingHeap()
+        open_set.push(start_idx, (abs(start[0] - goal[0]) + abs(start[1] - goal[1]), 0, start_idx))
         
         while open_set:
-            f_score, g_score, current, path = heapq.heappop(open_set)
-            
-            if current in visited:
-                continue
-            
-            visited.add(current)
+            current, (f_score, g_score, _) = open_set.pop()
             
-            if current == goal:
+            if current == goal_idx:
+                path = []
+                while current != start_idx:
+                    path.append((current // column - 1, current % column - 1))
+                    current = came_from[current]
+                path.append(start)
+                path.reverse()
                 return path
             
-            for neighbor in self.get_neighbors(current, allow_closed_doors=True):
-                if neighbor in visited:
-                    continue
-                
-                new_g_score = g_score + 1
-                new_path = path + [neighbor]
-                h_score = self.manhattan_distance(neighbor, goal)
-                new_f_score = new_g_score + h_score
-                
-                heapq.heappush(open_set, (new_f_score, new_g_score, neighbor, new_path))
+            new_g_score = g_score + 1
+            for offset in offsets:
+                neighbor = current + offset
+                if walk[neighbor] and new_g_score < g_scores[neighbor]:
+                    g_scores[neighbor] = new_g_score
+                    came_from[neighbor] = current
+                    h_score = h_cache.get(neighbor)
+                    if h_score is None:
+                        h_score = abs(neighbor // column - goal_x) + abs(neighbor % column - goal_y)
+                        h_cache[neighbor] = h_score
+                    open_set.push(neighbor, (new_g_score + h_score, new_g_score, neighbor))
         
         return None
     
-    def path_to_arrows(self, path: List[Tuple[int, int]]) -> str:
+    def find_path_bidirectional(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+        """Find an optimal path by growing fronts from both ends until they meet.
+        
+        Closed doors are walkable, as in find_path_astar, and the path has the
+        same length. Meant for one-off start/goal queries: the two fronts
+        together cover far fewer cells than one front reaching the goal.
+        """
+        if start == goal:
+            return [start]
+        
+        if not self.is_walkable(goal[0], goal[1], allow_closed_doors=True):
+            return None
+        if not (0 <= start[0] < self._width and 0 <= start[1] < self._height):
+            return None
+        
+        column = self._padded_column
+        walk = self._walk_padded
+        offsets = self._padded_offsets
+        start_idx = (start[0] + 1) * column + start[1] + 1
+        goal_idx = (goal[0] + 1) * column + goal[1] + 1
+        
+        # Step distance from the start (side 0) and from the goal (side 1),
+        # indexed like the padded mask; -1 = not reached by that side yet
+        size = len(walk)
+        dists = ([-1] * size, [-1] * size)
+        dists[0][start_idx] = 0
+        dists[1][goal_idx] = 0
+        fronts = [[start_idx], [goal_idx]]
+        depths = [0, 0]
+        
+        # Best known start-to-goal length through a cell reached by both sides
+        best = size
+        meet = -1
+        while meet < 0 and fronts[0] and fronts[1]:
+            # Grow the smaller front by one whole level; once the fronts touch,
+            # the cheapest meeting cell of that level lies on a shortest path
+            side = 0 if len(fronts[0]) <= len(fronts[1]) else 1
+            mine, other = dists[side], dists[1 - side]
+            depths[side] += 1
+            steps = depths[side]
+            next_front = []
+            for current in fronts[side]:
+                for offset in offsets:
+                    neighbor = current + offset
+                    if walk[neighbor] and mine[neighbor] < 0:
+                        mine[neighbor] = steps
+                        next_front.append(neighbor)
+                        if other[neighbor] >= 0 and steps + other[neighbor] < best:
+                            best = steps + other[neighbor]
+                            meet = neighbor
+            fronts[side] = next_front
+        
+        if meet < 0:
+            return None
+        
+        # Walk down each distance field from the meeting cell to its origin
+        halves = []
+        for dist in dists:
+            node = meet
+            half = [node]
+            while dist[node]:
+                node = next(node + offset for offset in offsets if dist[node + offset] == dist[node] - 1)
+                half.append(node)
+            halves.append(half)
+        halves[0].reverse()
+        return [(node // column - 1, node % column - 1) for node in halves[0] + halves[1][1:]]
+    
+    def _bfs_distances(self, start: Tuple[int, int]) -> List[int]:
+        """Step distance from start to every cell, closed doors walkable.
+        
+        Indexed like the padded search mask, ``(x + 1) * column + (y + 1)``;
+        unreachable cells are -1.
+        """
+        column = self._padded_column
+        walk = self._walk_padded
+        offsets = self._padded_offsets
+        dist = [-1] * len(walk)
+        if not (0 <= start[0] < self._width and 0 <= start[1] < self._height):
+            return dist
+        
+        start_idx = (start[0] + 1) * column + start[1] + 1
+        dist[start_idx] = 0
+        frontier = [start_idx]
+        # Level-synchronous BFS: every cell in frontier is `steps` away
+        steps = 0
+        while frontier:
+            steps += 1
+            next_frontier = []
+            for current in frontier:
+                for offset in offsets:
+                    neighbor = current + offset
+                    if walk[neighbor] and dist[neighbor] < 0:
+                        dist[neighbor] = steps
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        return dist
+    
+    def _find_path_compiled(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+        """Shortest path via the numba A* kernel; same paths as the Python search."""
+        column = self._padded_column
+        start_idx = (start[0] + 1) * column + start[1] + 1
+        goal_idx = (goal[0] + 1) * column + goal[1] + 1
+        parent = _astar_parents(self._walk_array, column, start_idx, goal_idx)
+        if parent[goal_idx] < 0:
+            return None
+        
+        path = []
+        node = goal_idx
+        while node != start_idx:
+            path.append((node // column - 1, node % column - 1))
+            node = int(parent[node])
+        path.append(start)
+        path.reverse()
+        return path
+    
+    def path_to_arrows(self, path: Sequence[Tuple[int, int]]) -> str:
         """Convert a path to arrow notation."""
         if len(path) < 2:
             return ""
@@ -176,19 +671,19 @@ class PathfindingValidator:
             prev_x, prev_y = path[i-1]
             curr_x, curr_y = path[i]
             
-            dx = curr_x - prev_x
-            dy = curr_y - prev_y
-            
-            for direction in Direction:
-                if direction.dx == dx and direction.dy == dy:
-                    arrows.append(direction.symbol)
-                    break
+            symbol = _DELTA_TO_SYM.get((curr_x - prev_x, curr_y - prev_y))
+            if symbol is not None:
+                arrows.append(symbol)
         
         return "".join(arrows)
     
     def validate_path(self, start: Tuple[int, int], target: Tuple[int, int], 
-                     arrow_path: str) -> PathResult:
-        """Validate a path given as arrow notation."""
+                     arrow_path: str, opt_idx_of: Optional[Dict[Tuple[int, int], int]] = None) -> PathResult:
+        """Validate a path given as arrow notation (↑↓←→, or the letters U/D/L/R).
+        
+        With opt_idx_of (optimal-path position -> index along it), the walk also
+        records result.last_optimal_index.
+        """
         
         # Initialize result
         result = PathResult(
@@ -213,43 +708,50 @@ class PathfindingValidator:
             result.error_message = f"Target position {target} is not walkable"
             return result
         
-        # Execute the path step by step
-        current_x, current_y = start
-        
-        for i, symbol in enumerate(arrow_path):
-            direction = Direction.from_symbol(symbol)
-            if direction is None:
-                result.is_valid = False
-                result.error_message = f"Invalid direction symbol '{symbol}' at position {i}"
-                break
-            
-            new_x = current_x + direction.dx
-            new_y = current_y + direction.dy
-            
-            cell_value = self.layout.get_cell(new_x, new_y)
-            # If it's a closed door, simulate opening it before moving
-            if cell_value == constants.CLOSED_DOOR:
-                # Simulate opening the door (in real sim, would require an action)
-                # For validation, just allow the move
-                pass  # Door is now open for this step
-            elif not self.is_walkable(new_x, new_y):
-                result.is_valid = False
-                result.error_message = f"Cannot move {direction.symbol} from ({current_x}, {current_y}) to ({new_x}, {new_y}) - blocked"
-                break
-            
-            # Execute the move
-            current_x, current_y = new_x, new_y
-            result.path_taken.append((current_x, current_y))
-            result.steps_taken += 1
+        # Turn the whole arrow string into flat-index offsets, then into the
+        # visited indices with one running sum; only the first failure matters
+        column = self._padded_column
+        offsets = [self._sym_to_offset.get(symbol) for symbol in arrow_path]
+        try:
+            bad_symbol_at = offsets.index(None)
+        except ValueError:
+            bad_symbol_at = len(offsets)
+        start_idx = (start[0] + 1) * column + start[1] + 1
+        indices = list(itertools.accumulate(itertools.chain((start_idx,), offsets[:bad_symbol_at])))
+        
+        # Closed doors count as passable: opening one is simulated for each
+        # step (in the real sim it would require an action). Leaving the grid
+        # lands on the unwalkable border first, so indices stay in range.
+        walk = self._walk_padded
+        blocked_at = next((step for step in range(1, len(indices)) if not walk[indices[step]]), None)
+        
+        steps = blocked_at - 1 if blocked_at is not None else bad_symbol_at
+        result.path_taken = [(idx // column - 1, idx % column - 1) for idx in indices[:steps + 1]]
+        result.steps_taken = steps
+        if opt_idx_of is not None:
+            last_opt_idx = 0
+            for pos in itertools.islice(result.path_taken, 1, None):
+                last_opt_idx = opt_idx_of.get(pos, last_opt_idx)
+            result.last_optimal_index = last_opt_idx
+        current_x, current_y = result.path_taken[-1]
+        
+        if blocked_at is not None:
+            blocked = indices[blocked_at]
+            new_x, new_y = blocked // column - 1, blocked % column - 1
+            result.is_valid = False
+            result.error_message = f"Cannot move {arrow_path[steps]} from ({current_x}, {current_y}) to ({new_x}, {new_y}) - blocked"
+        elif bad_symbol_at < len(arrow_path):
+            result.is_valid = False
+            result.error_message = f"Invalid direction symbol '{arrow_path[bad_symbol_at]}' at position {bad_symbol_at}"
         
         result.final_position = (current_x, current_y)
         result.reached_target = (result.final_position == target)
         
         # Calculate efficiency if we have a valid result
         if result.is_valid:
-            optimal_path = self.find_path_astar(start, target)
-            if optimal_path:
-                result.optimal_length = len(optimal_path) - 1  # Number of steps
+            optimal_length = self._optimal_length(start, target)
+            if optimal_length is not None:
+                result.optimal_length = optimal_length  # Number of steps
                 if result.steps_taken > 0:
                     result.efficiency = result.optimal_length / result.steps_taken
                 else:
@@ -262,17 +764,11 @@ class PathfindingValidator:
         if seed is not None:
             random.seed(seed)
         
-        # Get all objects in the world
-        objects = self.sim.get_objects()
+        # Get all objects in the world, and which are inside containers
+        objects, excluded_ids = self._get_visible_objects()
         if not objects:
             return None
         
-        # Filter out contained objects (only use objects that appear in "Objects in apartment" list)
-        excluded_ids = set()
-        for obj in objects:
-            if hasattr(obj, 'contents'):
-                excluded_ids.update(obj.contents)
-        
         # Only consider objects that are not contained within other objects
         available_objects = [obj for obj in objects if obj.id not in excluded_ids]
         
@@ -280,15 +776,17 @@ class PathfindingValidator:
             return None
         
         # Use current agent position as start
-        start_pos = (self.sim.agent_x, self.sim.agent_y)
-        
-        # Test pathfinding to each available object before choosing one
-        valid_targets = []
-        for obj in available_objects:
-            target_pos = (obj.x, obj.y)
-            optimal_path = self.find_path_astar(start_pos, target_pos)
-            if optimal_path and len(optimal_path) >= 2:
-                valid_targets.append(obj)
+        start_pos = self._agent_pos
+        
+        # One BFS from the start tells which objects are reachable at least
+        # one step away; only the chosen target needs an actual path
+        dist = self._bfs_distances(start_pos)
+        column = self._padded_column
+        valid_targets = [
+            obj for obj in available_objects
+            if 0 <= obj.x < self._width and 0 <= obj.y < self._height
+            and dist[(obj.x + 1) * column + obj.y + 1] >= 1
+        ]
         
         if not valid_targets:
             return None
@@ -297,15 +795,14 @@ class PathfindingValidator:
         target_obj = random.choice(valid_targets)
         target_pos = (target_obj.x, target_obj.y)
         
-        # Find optimal path
-        optimal_path = self.find_path_astar(start_pos, target_pos)
+        # Find optimal path; it stays memoized, so validating answers to this
+        # challenge reads its length instead of searching again
+        optimal_path, optimal_arrows, distance = self._optimal(
+            start_pos, target_pos, self.find_path_bidirectional)
         if not optimal_path or len(optimal_path) < 2:
             return None
         
-        optimal_arrows = self.path_to_arrows(optimal_path)
-        
         # Create challenge description
-        distance = len(optimal_path) - 1
         description = f"Navigate to the {target_obj.name}"
         
         return NavigationChallenge(
@@ -345,53 +842,10 @@ class PathfindingValidator:
         print("🏠 Apartment Layout:")
         print("=" * 50)
         
-        width = self.layout.width
-        height = self.layout.height
-        
-        # Create the grid
-        grid = []
-        for y in range(height):
-            row = []
-            for x in range(width):
-                cell_value = self.layout.get_cell(x, y)
-                # Map cell value to character
-                if cell_value < 0:
-                    if cell_value == constants.WALL:
-                        char = '■'  # wall
-                    elif cell_value == constants.OUTSIDE:
-                        char = ' '  # outside
-                    elif cell_value == constants.CLOSED_DOOR:
-                        char = 'D'  # closed door
-                    elif cell_value == constants.OPEN_DOOR:
-                        char = 'd'  # open door
-                    else:
-                        char = '?'  # unknown
-                else:
-                    # room cell: empty square symbol
-                    char = '□'
-                row.append(char)
-            grid.append(row)
-        
-        # Place objects with their IDs (avoiding contained objects)
-        objects = self.sim.get_objects()
-        excluded_ids = set()
-        for obj in objects:
-            if hasattr(obj, 'contents'):
-                excluded_ids.update(obj.contents)
-        
-        for obj in objects:
-            if obj.id not in excluded_ids and 0 <= obj.x < width and 0 <= obj.y < height:
-                grid[obj.y][obj.x] = str(obj.id)
+        print(self.render_ascii())
         
-        # Place agent as '@'
-        agent_x = self.sim.agent_x
-        agent_y = self.sim.agent_y
-        if 0 <= agent_x < width and 0 <= agent_y < height:
-            grid[agent_y][agent_x] = '@'
-        
-        # Print the grid
-        for row in grid:
-            print(''.join(row))
+        objects, excluded_ids = self._get_visible_objects()
+        agent_x, agent_y = self._agent_pos
         
         print()
         print("Legend:")
@@ -503,47 +957,7 @@ class ApartmentSimEnv:
         self.sim = tidy_env_py.PySimulator(opts)
         self.validator = PathfindingValidator(self.sim)
         self.challenge = self.validator.create_navigation_challenge(seed=seed)
-        # Generate ASCII layout
-        ascii_lines = []
-        width = self.validator.layout.width
-        height = self.validator.layout.height
-        grid = []
-        for y in range(height):
-            row = []
-            for x in range(width):
-                cell_value = self.validator.layout.get_cell(x, y)
-                if cell_value < 0:
-                    if cell_value == constants.WALL:
-                        char = '■'
-                    elif cell_value == constants.OUTSIDE:
-                        char = ' '
-                    elif cell_value == constants.CLOSED_DOOR:
-                        char = 'D'
-                    elif cell_value == constants.OPEN_DOOR:
-                        char = 'd'
-                    else:
-                        char = '?'
-                else:
-                    char = '□'
-                row.append(char)
-            grid.append(row)
-        # Place objects
-        objects = self.sim.get_objects()
-        excluded_ids = set()
-        for obj in objects:
-            if hasattr(obj, 'contents'):
-                excluded_ids.update(obj.contents)
-        for obj in objects:
-            if obj.id not in excluded_ids and 0 <= obj.x < width and 0 <= obj.y < height:
-                grid[obj.y][obj.x] = str(obj.id)
-        # Place agent
-        agent_x = self.sim.agent_x
-        agent_y = self.sim.agent_y
-        if 0 <= agent_x < width and 0 <= agent_y < height:
-            grid[agent_y][agent_x] = '@'
-        for row in grid:
-            ascii_lines.append(''.join(row))
-        self._ascii = '\n'.join(ascii_lines)
+        self._ascii = self.validator.render_ascii()
         return self
 
     def ascii(self):
@@ -558,31 +972,28 @@ class ApartmentSimEnv:
         """Evaluate a path for the current challenge. Returns a dict with is_valid, efficiency, cross_score."""
         if self.sim is None or self.challenge is None:
             raise RuntimeError("Call reset() before reward().")
-        result = self.validator.validate_path(self.challenge.start, self.challenge.target, path_arrows)
-        is_valid = 1 if result.is_valid else 0
-        efficiency = result.efficiency if result.is_valid else 0
-        cross_score = None
-        if not result.is_valid:
-            optimal_path = self.validator.find_path_astar(self.challenge.start, self.challenge.target)
-            if optimal_path and len(optimal_path) > 1:
-                optimal_set = set(optimal_path)
-                last_cross = -1
-                for idx, pos in enumerate(result.path_taken):
-                    if pos in optimal_set:
-                        last_cross = idx
-                if last_cross > 0:
-                    last_pos = result.path_taken[last_cross]
-                    try:
-                        opt_idx = optimal_path.index(last_pos)
-                        cross_score = opt_idx / (len(optimal_path) - 1)
-                    except Exception:
-                        cross_score = 0.0
-                else:
-                    cross_score = 0.0
-        else:
-            cross_score = 1.0  # If valid, assume full cross score
-        return {
-            'is_valid': is_valid,
-            'efficiency': efficiency,
-            'cross_score': cross_score
-        }
\ No newline at end of file
+        return self.reward_batch([path_arrows])[0]
+
+    def reward_batch(self, paths: List[str]) -> List[dict]:
+        """Evaluate several paths for the current challenge, one reward dict per path.
+
+        Cross scores come from the challenge's own optimal path, so no search runs here.
+        """
+        if self.sim is None or self.challenge is None:
+            raise RuntimeError("Call reset() before reward_batch().")
+        start, target = self.challenge.start, self.challenge.target
+        optimal_path = self.challenge.optimal_path
+        opt_idx_of = {pos: i for i, pos in enumerate(optimal_path)}
+        rewards = []
+        for path_arrows in paths:
+            result = self.validator.validate_path(start, target, path_arrows, opt_idx_of=opt_idx_of)
+            if result.is_valid:
+                # If valid, assume full cross score
+                rewards.append({'is_valid': 1, 'efficiency': result.efficiency, 'cross_score': 1.0})
+                continue
+            rewards.append({
+                'is_valid': 0,
+                'efficiency': 0,
+                'cross_score': result.last_optimal_index / (len(optimal_path) - 1) if len(optimal_path) > 1 else None
+            })
+        return rewards
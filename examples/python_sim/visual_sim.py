@@ -13,9 +13,11 @@ Usage:
 
 import sys
 import argparse
+import io
 import os
+import shutil
 import time
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
 
 # Try to import tidy_env_py directly (if installed in venv)
 try:
@@ -36,6 +38,14 @@ except ImportError:
         print(f"Import error: {e}")
         sys.exit(1)
 
+# Single-key input: termios/tty on POSIX, msvcrt on Windows
+try:
+    import termios
+    import tty
+except ImportError:
+    termios = None
+    import msvcrt
+
 try:
     from colorama import init, Fore, Back, Style
     init()  # Initialize colorama for Windows compatibility
@@ -51,41 +61,299 @@ except ImportError:
     class Style:
         BRIGHT = DIM = RESET_ALL = ""
 
+# Optional: assemble map views with a numba kernel when it is installed
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Glyph ids used by the compiled view kernel; VisualSimulator._glyph_strings
+# holds the colored string of each id
+GLYPH_OUTSIDE, GLYPH_WALL, GLYPH_FLOOR, GLYPH_DOOR_CLOSED, GLYPH_DOOR_OPEN, \
+    GLYPH_OBJECT_SMALL, GLYPH_OBJECT_LARGE, GLYPH_AGENT = range(8)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _build_glyph_ids(grid, objects, start_x, start_y, end_x, end_y, agent_x, agent_y, out):
+        """Fill out with the glyph id of every cell of a map window.
+        
+        grid holds the cell glyph ids and objects the object glyph id of each
+        cell (0 where empty); objects cover cells and the agent covers both.
+        """
+        for y in range(start_y, end_y):
+            for x in range(start_x, end_x):
+                glyph = objects[y, x]
+                if glyph == 0:
+                    glyph = grid[y, x]
+                out[y - start_y, x - start_x] = glyph
+        if start_x <= agent_x < end_x and start_y <= agent_y < end_y:
+            out[agent_y - start_y, agent_x - start_x] = GLYPH_AGENT
+
+
+# Arrow keys move the agent. POSIX terminals send ESC [ or ESC O followed by
+# a final letter; Windows sends a '\x00' or '\xe0' prefix and a scan code.
+_ESCAPE_ARROWS = {'A': 'w', 'B': 's', 'C': 'd', 'D': 'a'}
+_SCAN_CODE_ARROWS = {'H': 'w', 'P': 's', 'M': 'd', 'K': 'a'}
+
+
+def _read_escape_sequence(fd: int) -> str:
+    """Consume the rest of an escape sequence after ESC; return its move key or ''.
+    
+    Reads time out after 0.1 s, so a lone ESC does not wait for more input.
+    """
+    attrs = termios.tcgetattr(fd)
+    attrs[6][termios.VMIN] = 0
+    attrs[6][termios.VTIME] = 1
+    termios.tcsetattr(fd, termios.TCSANOW, attrs)
+    
+    if sys.stdin.read(1) not in ('[', 'O'):
+        return ''
+    final = sys.stdin.read(1)
+    # Skip parameter bytes, e.g. the "1;5" of CTRL+Up
+    while final and not '@' <= final <= '~':
+        final = sys.stdin.read(1)
+    return _ESCAPE_ARROWS.get(final, '')
+
+
+def _getch() -> str:
+    """Read one key press without waiting for Enter (no echo).
+    
+    Falls back to reading a whole line when stdin is not a terminal, e.g.
+    when commands are piped in. Upper/lower case stay distinct, so
+    SHIFT+WASD arrive as 'W', 'A', 'S', 'D'. Arrow keys come back as their
+    WASD move; other multi-byte key sequences are skipped whole.
+    """
+    if not sys.stdin.isatty():
+        return input()
+    
+    ch = ''
+    while not ch:
+        if termios is None:
+            ch = msvcrt.getwch()
+            if ch in ('\x00', '\xe0'):
+                ch = _SCAN_CODE_ARROWS.get(msvcrt.getwch(), '')
+        else:
+            fd = sys.stdin.fileno()
+            old_attrs = termios.tcgetattr(fd)
+            try:
+                tty.setcbreak(fd)
+                ch = sys.stdin.read(1)
+                if ch == '\x1b':
+                    ch = _read_escape_sequence(fd)
+                elif ch == '':
+                    raise EOFError
+            finally:
+                termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
+    
+    if ch == '\x03':
+        raise KeyboardInterrupt
+    if ch in ('\x04', '\x1a'):
+        raise EOFError
+    return ch
+
+
+def _leave_alt_screen() -> None:
+    """Show the cursor again and switch back to the normal screen buffer."""
+    sys.stdout.write("\x1b[?25h\x1b[?1049l")
+    sys.stdout.flush()
+
+
+# Row pieces shared by the map drawers (column-number indent, line end)
+ROW_PREFIX = "   "
+NEWLINE = "\n"
+
+# Cells shown on each side of the agent in the local view
+LOCAL_VIEW_RADIUS = 7
+
+# Column-number digits, sliced rather than formatted per column; covers views
+# up to 90 columns wide
+_DIGITS = "0123456789" * 10
+
+
+def _column_numbers(start_x: int, end_x: int) -> str:
+    """Last digit of every column number in [start_x, end_x)."""
+    offset = start_x % 10
+    return _DIGITS[offset:offset + end_x - start_x]
+
+# Neighbours shown by the look-around view: (dx, dy, colored label)
+_DIRS = tuple(
+    (dx, dy, f"{Fore.CYAN}{name}:{Style.RESET_ALL} ")
+    for dx, dy, name in ((0, -1, "North"), (0, 1, "South"), (-1, 0, "West"), (1, 0, "East"))
+)
+_CLOSED_STR = f"{Fore.RED}Closed door{Style.RESET_ALL}"
+_OPEN_STR = f"{Fore.GREEN}Open door{Style.RESET_ALL}"
+
+# Finished last-action messages and prompts (color codes resolved once)
+_MOVED_UP = f"{Fore.GREEN}Moved up{Style.RESET_ALL}"
+_MOVED_DOWN = f"{Fore.GREEN}Moved down{Style.RESET_ALL}"
+_MOVED_LEFT = f"{Fore.GREEN}Moved left{Style.RESET_ALL}"
+_MOVED_RIGHT = f"{Fore.GREEN}Moved right{Style.RESET_ALL}"
+_DOOR_NORTH = f"{Fore.YELLOW}Interacted with door (north){Style.RESET_ALL}"
+_DOOR_SOUTH = f"{Fore.YELLOW}Interacted with door (south){Style.RESET_ALL}"
+_DOOR_WEST = f"{Fore.YELLOW}Interacted with door (west){Style.RESET_ALL}"
+_DOOR_EAST = f"{Fore.YELLOW}Interacted with door (east){Style.RESET_ALL}"
+_NOT_HOLDING = f"{Fore.RED}Not holding anything{Style.RESET_ALL}"
+_NO_CONTAINERS = f"{Fore.RED}No containers here{Style.RESET_ALL}"
+_INVALID_CHOICE = f"{Fore.RED}Invalid choice{Style.RESET_ALL}"
+_CANCELLED = f"{Fore.RED}Cancelled{Style.RESET_ALL}"
+_PRESS_ENTER = f"\n{Fore.GREEN}Press Enter to continue...{Style.RESET_ALL}"
+
 
 class VisualSimulator:
     def __init__(self, opts: tidy_env_py.PyGenOpts):
         """Initialize the visual simulator."""
         self.sim = tidy_env_py.PySimulator(opts)
-        self.layout = self.sim.get_layout()
         self.last_action = ""
         self.step_count = 0
         
-        # Color scheme
+        # Color scheme: finished, terminal-ready glyph strings (color, glyph
+        # and reset), so drawing a cell is a single dict lookup
         self.colors = {
-            'wall': Fore.WHITE + Back.BLACK,
-            'floor': Fore.CYAN + '·',
-            'agent': Fore.YELLOW + Style.BRIGHT + '@',
-            'door_closed': Fore.RED + '+',
-            'door_open': Fore.GREEN + '-',
-            'object_small': Fore.MAGENTA + '.',
-            'object_large': Fore.BLUE + '█',
+            'wall': Fore.WHITE + Back.BLACK + '█' + Style.RESET_ALL,
+            'floor': Fore.CYAN + '·' + Style.RESET_ALL,
+            'agent': Fore.YELLOW + Style.BRIGHT + '@' + Style.RESET_ALL,
+            'door_closed': Fore.RED + '+' + Style.RESET_ALL,
+            'door_open': Fore.GREEN + '-' + Style.RESET_ALL,
+            'object_small': Fore.MAGENTA + '.' + Style.RESET_ALL,
+            'object_large': Fore.BLUE + '█' + Style.RESET_ALL,
             'outside': ' ',
-            'reset': Style.RESET_ALL
         }
+        # Fixed parts of the status panel, rendered once
+        self._panel_header = "\n".join([
+            f"\n{Fore.GREEN}{'='*50}{Style.RESET_ALL}",
+            f"{Fore.GREEN}STATUS{Style.RESET_ALL}",
+            f"{Fore.GREEN}{'='*50}{Style.RESET_ALL}",
+        ])
+        self._legend_block = "\n".join([
+            f"\n{Fore.CYAN}Legend:{Style.RESET_ALL}",
+            f"  {self.colors['agent']} = You",
+            f"  {self.colors['floor']} = Floor",
+            f"  {self.colors['wall']} = Wall",
+            f"  {self.colors['door_closed']} = Closed door",
+            f"  {self.colors['door_open']} = Open door",
+            f"  {self.colors['object_small']} = Small object",
+            f"  {self.colors['object_large']} = Furniture",
+            "",
+        ])
+        self._glyph_strings = (
+            self.colors['outside'], self.colors['wall'], self.colors['floor'],
+            self.colors['door_closed'], self.colors['door_open'],
+            self.colors['object_small'], self.colors['object_large'], self.colors['agent'],
+        )
+        
+        # Render caches, refreshed only when the simulator state changes;
+        # each refresh bumps its version
+        self._layout_version = 0
+        self._objects_version = 0
+        self._refresh_layout()
+        self._rebuild_object_index()
+        
+        # Room names never change; read them once (index = room cell value)
+        self._room_names = self.layout.room_names
+        
+        # Full-map size, limited for readability
+        self._max_w = min(self.layout.width, 30)
+        self._max_h = min(self.layout.height, 20)
+        
+        # What the last local view left on screen: (column, row) within the
+        # view -> cell string, and the (start_x, start_y, end_x, end_y) it
+        # covered. Empty while the screen shows something else.
+        self._prev_frame: Dict[Tuple[int, int], str] = {}
+        self._prev_view: Optional[Tuple[int, int, int, int]] = None
+        # (agent_x, agent_y, radius, layout version, objects version) of that view
+        self._last_frame_key: Optional[Tuple[int, ...]] = None
+        
+        # Command key -> (action, args, last-action label or None, counts as a step)
+        self._dispatch = {
+            'w': (self.sim.move_up, (), _MOVED_UP, True),
+            's': (self.sim.move_down, (), _MOVED_DOWN, True),
+            'a': (self.sim.move_left, (), _MOVED_LEFT, True),
+            'd': (self.sim.move_right, (), _MOVED_RIGHT, True),
+            'W': (self._interact, (0, -1), _DOOR_NORTH, False),
+            'S': (self._interact, (0, 1), _DOOR_SOUTH, False),
+            'A': (self._interact, (-1, 0), _DOOR_WEST, False),
+            'D': (self._interact, (1, 0), _DOOR_EAST, False),
+            'p': (self._pick_up, (), None, False),
+            'r': (self._drop, (), None, False),
+            'i': (self.handle_place_into, (), None, False),
+            'l': (self._show_look, (), None, False),
+            'o': (self.show_all_objects, (), None, False),
+            'm': (self._show_map, (), None, False),
+            'h': (self.show_help, (), None, False),
+        }
+    
+    def _refresh_layout(self):
+        """Snapshot the layout and pre-render the glyph of every cell.
         
-        self.clear_screen()
-        self.show_welcome()
+        The cells are read with one bulk FFI call into _glyphs, one list of
+        glyph strings per row; views are sliced out of it. Doors are redrawn
+        by taking a new snapshot after interact().
+        """
+        self.layout = self.sim.get_layout()
+        self._cells = self.layout.cells
+        self._layout_version += 1
+        width = self.layout.width
+        glyph_of = {
+            constants.WALL: self.colors['wall'],
+            constants.OUTSIDE: self.colors['outside'],
+            constants.CLOSED_DOOR: self.colors['door_closed'],
+            constants.OPEN_DOOR: self.colors['door_open'],
+        }
+        floor = self.colors['floor']
+        self._glyphs: List[List[str]] = [
+            [glyph_of.get(cell, floor) for cell in self._cells[y * width:(y + 1) * width]]
+            for y in range(self.layout.height)
+        ]
+        
+        if NUMBA_AVAILABLE:
+            # The same grid as glyph ids for the compiled view kernel
+            id_of = {
+                constants.WALL: GLYPH_WALL,
+                constants.OUTSIDE: GLYPH_OUTSIDE,
+                constants.CLOSED_DOOR: GLYPH_DOOR_CLOSED,
+                constants.OPEN_DOOR: GLYPH_DOOR_OPEN,
+            }
+            self._grid_ids = np.array(
+                [id_of.get(cell, GLYPH_FLOOR) for cell in self._cells], dtype=np.int8
+            ).reshape(self.layout.height, width)
+    
+    def _room_name(self, cell_value: int) -> str:
+        """Name of the room a cell belongs to, or "Outside" for non-room cells."""
+        if cell_value < 0:
+            return "Outside"
+        return self._room_names[cell_value]
+    
+    def _rebuild_object_index(self):
+        """Index objects by (x, y) from a single get_objects() call."""
+        object_index: Dict[Tuple[int, int], list] = {}
+        for obj in self.sim.get_objects():
+            object_index.setdefault((obj.x, obj.y), []).append(obj)
+        self._object_index = object_index
+        self._objects_version += 1
+        
+        if NUMBA_AVAILABLE:
+            # Glyph id of the first object on each cell, 0 where there is none
+            self._object_ids = np.zeros((self.layout.height, self.layout.width), dtype=np.int8)
+            for (x, y), objects_here in object_index.items():
+                self._object_ids[y, x] = GLYPH_OBJECT_SMALL if objects_here[0].pickable else GLYPH_OBJECT_LARGE
     
     def clear_screen(self):
-        """Clear the terminal screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        """Clear the terminal screen with ANSI codes (no subprocess)."""
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
+        self._prev_frame = {}
+        self._prev_view = None
+        self._last_frame_key = None
     
     def show_welcome(self):
         """Show welcome message."""
         print(f"{Fore.GREEN}{'='*60}{Style.RESET_ALL}")
         print(f"{Fore.GREEN}🏠 VISUAL APARTMENT SIMULATOR 🏠{Style.RESET_ALL}")
         print(f"{Fore.GREEN}{'='*60}{Style.RESET_ALL}")
-        print(f"Generated apartment: {self.layout.width}x{self.layout.height} with {len(self.layout.room_names)} rooms")
+        print(f"Generated apartment: {self.layout.width}x{self.layout.height} with {len(self._room_names)} rooms")
         print(f"Total objects: {len(self.sim.get_objects())}")
         print(f"Agent starting at: ({self.sim.agent_x}, {self.sim.agent_y})")
         print(f"\n{Fore.YELLOW}Controls:{Style.RESET_ALL}")
@@ -93,120 +361,151 @@ class VisualSimulator:
         print("I = Place into container, L = Look, O = Objects, H = Help, Q = Quit")
         input(f"\n{Fore.GREEN}Press Enter to start...{Style.RESET_ALL}")
     
-    def get_cell_display(self, x: int, y: int) -> str:
-        """Get the colored character representation of a cell."""
-        if x >= self.layout.width or y >= self.layout.height:
-            return self.colors['outside']
-        
-        cell_value = self.layout.get_cell(x, y)
-        
-        # Check if agent is at this position
-        if x == self.sim.agent_x and y == self.sim.agent_y:
-            return self.colors['agent'] + self.colors['reset']
-        
-        # Check for objects at this position
-        objects_here = self.sim.get_objects_at(x, y)
-        if objects_here:
-            obj = objects_here[0]
-            if obj.pickable:
-                return self.colors['object_small'] + self.colors['reset']
-            else:
-                return self.colors['object_large'] + self.colors['reset']
-        
-        # Show cell type
-        if cell_value == constants.WALL:
-            return self.colors['wall'] + '█' + self.colors['reset']
-        elif cell_value == constants.OUTSIDE:
-            return self.colors['outside']
-        elif cell_value == constants.CLOSED_DOOR:
-            return self.colors['door_closed'] + self.colors['reset']
-        elif cell_value == constants.OPEN_DOOR:
-            return self.colors['door_open'] + self.colors['reset']
-        else:
-            # Room cell
-            return self.colors['floor'] + self.colors['reset']
+    def _view_rows(self, start_x: int, start_y: int, end_x: int, end_y: int,
+                   agent: Tuple[int, int]) -> List[List[str]]:
+        """Glyph rows of a window of the map, with objects and the agent drawn in.
+        
+        Rows are sliced from the pre-rendered grid; only cells holding an
+        object or the agent are overwritten. With numba, a compiled kernel
+        picks the glyph id of every cell instead.
+        """
+        if NUMBA_AVAILABLE:
+            out = np.empty((end_y - start_y, end_x - start_x), dtype=np.int8)
+            _build_glyph_ids(self._grid_ids, self._object_ids, start_x, start_y, end_x, end_y,
+                             agent[0], agent[1], out)
+            strings = self._glyph_strings
+            return [[strings[glyph] for glyph in row] for row in out.tolist()]
+        
+        rows = [glyph_row[start_x:end_x] for glyph_row in self._glyphs[start_y:end_y]]
+        
+        small, large = self.colors['object_small'], self.colors['object_large']
+        for (x, y), objects_here in self._object_index.items():
+            if start_x <= x < end_x and start_y <= y < end_y:
+                rows[y - start_y][x - start_x] = small if objects_here[0].pickable else large
+        
+        agent_x, agent_y = agent
+        if start_x <= agent_x < end_x and start_y <= agent_y < end_y:
+            rows[agent_y - start_y][agent_x - start_x] = self.colors['agent']
+        return rows
     
     def draw_full_map(self):
         """Draw the complete apartment map."""
-        print(f"\n{Fore.CYAN}Full Apartment Map:{Style.RESET_ALL}")
-        print("   ", end="")
-        for x in range(min(self.layout.width, 30)):  # Limit width for readability
-            print(f"{x%10}", end="")
-        print()
-        
-        for y in range(min(self.layout.height, 20)):  # Limit height for readability
-            print(f"{y:2} ", end="")
-            for x in range(min(self.layout.width, 30)):
-                print(self.get_cell_display(x, y), end="")
-            print(f" {y}")
-    
-    def draw_local_view(self, radius: int = 7):
-        """Draw a local view around the agent."""
-        agent_x, agent_y = self.sim.agent_x, self.sim.agent_y
+        agent = (self.sim.agent_x, self.sim.agent_y)
+        width, height = self._max_w, self._max_h
         
-        start_x = max(0, agent_x - radius)
-        end_x = min(self.layout.width, agent_x + radius + 1)
-        start_y = max(0, agent_y - radius)
-        end_y = min(self.layout.height, agent_y + radius + 1)
+        # The whole map is built up and written at once
+        buf = [f"\n{Fore.CYAN}Full Apartment Map:{Style.RESET_ALL}\n", ROW_PREFIX]
+        buf.append(_column_numbers(0, width))
+        buf.append(NEWLINE)
         
-        print(f"\n{Fore.YELLOW}Local View (Agent at {agent_x}, {agent_y}):{Style.RESET_ALL}")
+        for y, row in enumerate(self._view_rows(0, 0, width, height, agent)):
+            buf.append(f"{y:2} ")
+            buf.extend(row)
+            buf.append(f" {y}\n")
         
-        # Print column numbers
-        print("   ", end="")
-        for x in range(start_x, end_x):
-            print(f"{x%10}", end="")
-        print()
+        sys.stdout.write("".join(buf))
+        sys.stdout.flush()
+    
+    def _local_view_bounds(self, agent_x: int, agent_y: int, radius: int) -> Tuple[int, int, int, int]:
+        """(start_x, start_y, end_x, end_y) of the local view around the agent."""
+        return (max(0, agent_x - radius), max(0, agent_y - radius),
+                min(self.layout.width, agent_x + radius + 1),
+                min(self.layout.height, agent_y + radius + 1))
+    
+    def draw_local_view_diff(self, radius: int = LOCAL_VIEW_RADIUS):
+        """Draw the local view in place, writing only cells that changed since the last frame.
+        
+        Cells are addressed with ANSI cursor moves and the frame goes out in a
+        single write; the cursor is left below the map, with the rest of the
+        screen cleared for the status panel. When neither the agent, the layout
+        nor the objects changed since that frame, the map is left alone.
+        """
+        agent_x, agent_y = agent = self.sim.agent_x, self.sim.agent_y
+        
+        frame_key = (agent_x, agent_y, radius, self._layout_version, self._objects_version)
+        if frame_key == self._last_frame_key:
+            start_y, end_y = self._prev_view[1], self._prev_view[3]
+            sys.stdout.write(f"\x1b[{end_y - start_y + 4};1H\x1b[J")
+            sys.stdout.flush()
+            return
         
-        for y in range(start_y, end_y):
-            print(f"{y:2} ", end="")
-            for x in range(start_x, end_x):
-                print(self.get_cell_display(x, y), end="")
-            print(f" {y}")
+        view = start_x, start_y, end_x, end_y = self._local_view_bounds(agent_x, agent_y, radius)
+        
+        prev = self._prev_frame
+        parts = []
+        if not prev:
+            # The screen holds something else; start from a blank one
+            parts.append("\x1b[2J")
+        
+        # Screen rows: 1 blank, 2 title, 3 column numbers, 4.. map rows
+        parts.append(f"\x1b[2;1H{Fore.YELLOW}Local View (Agent at {agent_x}, {agent_y}):{Style.RESET_ALL}\x1b[K")
+        
+        # Numbers and row labels only move when the view does
+        moved = view != self._prev_view
+        if moved:
+            parts.append("\x1b[3;1H" + ROW_PREFIX + _column_numbers(start_x, end_x) + "\x1b[K")
+            # Forget cells that fell outside a smaller view
+            width, height = end_x - start_x, end_y - start_y
+            for key in [key for key in prev if key[0] >= width or key[1] >= height]:
+                del prev[key]
+        
+        # Bound methods as locals for the per-cell loop
+        prev_get = prev.get
+        append = parts.append
+        view_rows = self._view_rows(start_x, start_y, end_x, end_y, agent)
+        for row, (y, cells) in enumerate(zip(range(start_y, end_y), view_rows)):
+            screen_row = row + 4
+            if moved:
+                append(f"\x1b[{screen_row};1H{y:2} ")
+            for column, cell in enumerate(cells):
+                if prev_get((column, row)) != cell:
+                    prev[(column, row)] = cell
+                    append(f"\x1b[{screen_row};{column + 4}H{cell}")
+            if moved:
+                append(f"\x1b[{screen_row};{end_x - start_x + 4}H {y}\x1b[K")
+        
+        parts.append(f"\x1b[{end_y - start_y + 4};1H\x1b[J")
+        self._prev_view = view
+        self._last_frame_key = frame_key
+        sys.stdout.write("".join(parts))
+        sys.stdout.flush()
     
-    def show_status_panel(self):
-        """Show the current status panel."""
-        print(f"\n{Fore.GREEN}{'='*50}{Style.RESET_ALL}")
-        print(f"{Fore.GREEN}STATUS{Style.RESET_ALL}")
-        print(f"{Fore.GREEN}{'='*50}{Style.RESET_ALL}")
+    def _status_panel_text(self) -> str:
+        """Text of the status panel, written in one go by refresh_display.
+        
+        Only the state lines are built here; the header and the legend are
+        pre-rendered in __init__.
+        """
+        lines = [self._panel_header]
         
         # Agent info
         x, y = self.sim.agent_x, self.sim.agent_y
-        cell_value = self.layout.get_cell(x, y)
-        room_name = "Outside"
-        if cell_value >= 0:
-            room_name = self.layout.get_room_name(cell_value)
+        room_name = self._room_name(self._cells[y * self.layout.width + x])
         
-        print(f"{Fore.YELLOW}Location:{Style.RESET_ALL} ({x}, {y}) in {room_name}")
-        print(f"{Fore.YELLOW}Steps:{Style.RESET_ALL} {self.step_count}")
+        lines.append(f"{Fore.YELLOW}Location:{Style.RESET_ALL} ({x}, {y}) in {room_name}")
+        lines.append(f"{Fore.YELLOW}Steps:{Style.RESET_ALL} {self.step_count}")
         
         # What you're holding
         holding = self.sim.get_holding()
         if holding:
-            print(f"{Fore.YELLOW}Holding:{Style.RESET_ALL} {Fore.MAGENTA}{holding.name}{Style.RESET_ALL}")
+            lines.append(f"{Fore.YELLOW}Holding:{Style.RESET_ALL} {Fore.MAGENTA}{holding.name}{Style.RESET_ALL}")
         else:
-            print(f"{Fore.YELLOW}Holding:{Style.RESET_ALL} Nothing")
+            lines.append(f"{Fore.YELLOW}Holding:{Style.RESET_ALL} Nothing")
         
         # Objects at current location
-        objects_here = self.sim.get_objects_at(x, y)
+        objects_here = self._object_index.get((x, y), ())
         if objects_here:
-            print(f"{Fore.YELLOW}Objects here:{Style.RESET_ALL}")
+            lines.append(f"{Fore.YELLOW}Objects here:{Style.RESET_ALL}")
             for obj in objects_here:
                 status = f"{Fore.MAGENTA}📦" if obj.pickable else f"{Fore.BLUE}🪑"
-                print(f"  {status} {obj.name}{Style.RESET_ALL}")
+                lines.append(f"  {status} {obj.name}{Style.RESET_ALL}")
         
         # Last action
         if self.last_action:
-            print(f"{Fore.YELLOW}Last action:{Style.RESET_ALL} {self.last_action}")
-        
-        # Legend
-        print(f"\n{Fore.CYAN}Legend:{Style.RESET_ALL}")
-        print(f"  {self.colors['agent']}@{Style.RESET_ALL} = You")
-        print(f"  {self.colors['floor']}{Style.RESET_ALL} = Floor")
-        print(f"  {self.colors['wall']}█{Style.RESET_ALL} = Wall")
-        print(f"  {self.colors['door_closed']}{Style.RESET_ALL} = Closed door")
-        print(f"  {self.colors['door_open']}{Style.RESET_ALL} = Open door")
-        print(f"  {self.colors['object_small']}{Style.RESET_ALL} = Small object")
-        print(f"  {self.colors['object_large']}{Style.RESET_ALL} = Furniture")
+            lines.append(f"{Fore.YELLOW}Last action:{Style.RESET_ALL} {self.last_action}")
+        
+        lines.append(self._legend_block)
+        return "\n".join(lines)
     
     def show_inventory_and_nearby(self):
         """Show detailed inventory and nearby objects."""
@@ -215,7 +514,7 @@ class VisualSimulator:
         
         # Current room objects
         x, y = self.sim.agent_x, self.sim.agent_y
-        objects_here = self.sim.get_objects_at(x, y)
+        objects_here = self._object_index.get((x, y), ())
         
         if objects_here:
             print(f"\n{Fore.YELLOW}Objects at your location:{Style.RESET_ALL}")
@@ -228,23 +527,26 @@ class VisualSimulator:
                 print(f"  {i+1}. {Fore.MAGENTA}{obj.name}{Style.RESET_ALL}: {obj.description}")
                 print(f"      {status}{capacity_info}")
         
-        # Nearby areas
-        directions = [(0, -1, "North"), (0, 1, "South"), (-1, 0, "West"), (1, 0, "East")]
-        for dx, dy, direction in directions:
+        # Nearby areas, read from the cell snapshot with locals for the lookups
+        cells = self._cells
+        width, height = self.layout.width, self.layout.height
+        object_index = self._object_index
+        CLOSED_DOOR, OPEN_DOOR, WALL = constants.CLOSED_DOOR, constants.OPEN_DOOR, constants.WALL
+        for dx, dy, label in _DIRS:
             adj_x, adj_y = x + dx, y + dy
-            if 0 <= adj_x < self.layout.width and 0 <= adj_y < self.layout.height:
-                adj_cell = self.layout.get_cell(adj_x, adj_y)
-                adj_objects = self.sim.get_objects_at(adj_x, adj_y)
+            if 0 <= adj_x < width and 0 <= adj_y < height:
+                adj_cell = cells[adj_y * width + adj_x]
+                adj_objects = object_index.get((adj_x, adj_y), ())
                 
                 info_parts = []
-                if adj_cell == constants.CLOSED_DOOR:
-                    info_parts.append(f"{Fore.RED}Closed door{Style.RESET_ALL}")
-                elif adj_cell == constants.OPEN_DOOR:
-                    info_parts.append(f"{Fore.GREEN}Open door{Style.RESET_ALL}")
-                elif adj_cell == constants.WALL:
+                if adj_cell == CLOSED_DOOR:
+                    info_parts.append(_CLOSED_STR)
+                elif adj_cell == OPEN_DOOR:
+                    info_parts.append(_OPEN_STR)
+                elif adj_cell == WALL:
                     info_parts.append("Wall")
                 elif adj_cell >= 0:
-                    room_name = self.layout.get_room_name(adj_cell)
+                    room_name = self._room_name(adj_cell)
                     info_parts.append(f"Room: {room_name}")
                 
                 if adj_objects:
@@ -254,96 +556,101 @@ class VisualSimulator:
                     info_parts.append(f"Objects: {', '.join(obj_names)}")
                 
                 if info_parts:
-                    print(f"{Fore.CYAN}{direction}:{Style.RESET_ALL} {', '.join(info_parts)}")
+                    print(label + ', '.join(info_parts))
     
     def refresh_display(self):
-        """Refresh the entire display."""
-        self.clear_screen()
-        self.draw_local_view()
-        self.show_status_panel()
+        """Refresh the display: changed map cells in place, then the status panel below.
+        
+        The in-place update addresses absolute screen rows, so it only holds
+        while the whole frame fits the terminal. A taller frame scrolls the
+        screen, and then every refresh starts from a cleared one instead.
+        """
+        panel = self._status_panel_text()
+        
+        # Map rows start at screen row 4; the panel follows them and the
+        # prompt takes the line after the panel
+        start_y, end_y = self._local_view_bounds(self.sim.agent_x, self.sim.agent_y, LOCAL_VIEW_RADIUS)[1::2]
+        frame_lines = (end_y - start_y + 3) + (panel.count("\n") + 1) + 1
+        if frame_lines > shutil.get_terminal_size().lines:
+            self.clear_screen()
+        
+        self.draw_local_view_diff()
+        sys.stdout.write(panel)
+        sys.stdout.flush()
     
     def handle_command(self, command: str) -> bool:
         """Handle a single command. Returns False if should quit."""
         command = command.strip()
         self.last_action = ""
         
+        if command == 'q':
+            return False
+        
+        entry = self._dispatch.get(command)
+        if entry is None:
+            self.last_action = f"{Fore.RED}Unknown command: {command}{Style.RESET_ALL}"
+            return True
+        
+        action, args, label, counts_step = entry
         try:
-            if command == 'q':
-                return False
-            elif command == 'w':
-                self.sim.move_up()
-                self.last_action = f"{Fore.GREEN}Moved up{Style.RESET_ALL}"
-                self.step_count += 1
-            elif command == 's':
-                self.sim.move_down()
-                self.last_action = f"{Fore.GREEN}Moved down{Style.RESET_ALL}"
+            action(*args)
+            if label:
+                self.last_action = label
+            if counts_step:
                 self.step_count += 1
-            elif command == 'a':
-                self.sim.move_left()
-                self.last_action = f"{Fore.GREEN}Moved left{Style.RESET_ALL}"
-                self.step_count += 1
-            elif command == 'd':
-                self.sim.move_right()
-                self.last_action = f"{Fore.GREEN}Moved right{Style.RESET_ALL}"
-                self.step_count += 1
-            elif command == 'W':
-                self.sim.interact(0, -1)
-                self.last_action = f"{Fore.YELLOW}Interacted with door (north){Style.RESET_ALL}"
-            elif command == 'S':
-                self.sim.interact(0, 1)
-                self.last_action = f"{Fore.YELLOW}Interacted with door (south){Style.RESET_ALL}"
-            elif command == 'A':
-                self.sim.interact(-1, 0)
-                self.last_action = f"{Fore.YELLOW}Interacted with door (west){Style.RESET_ALL}"
-            elif command == 'D':
-                self.sim.interact(1, 0)
-                self.last_action = f"{Fore.YELLOW}Interacted with door (east){Style.RESET_ALL}"
-            elif command == 'p':
-                self.sim.pick_up()
-                holding = self.sim.get_holding()
-                if holding:
-                    self.last_action = f"{Fore.MAGENTA}Picked up: {holding.name}{Style.RESET_ALL}"
-            elif command == 'r':
-                holding = self.sim.get_holding()
-                if holding:
-                    self.sim.drop()
-                    self.last_action = f"{Fore.MAGENTA}Dropped: {holding.name}{Style.RESET_ALL}"
-                else:
-                    self.last_action = f"{Fore.RED}Not holding anything{Style.RESET_ALL}"
-            elif command == 'i':
-                self.handle_place_into()
-            elif command == 'l':
-                self.clear_screen()
-                self.show_inventory_and_nearby()
-                input(f"\n{Fore.GREEN}Press Enter to continue...{Style.RESET_ALL}")
-            elif command == 'o':
-                self.show_all_objects()
-            elif command == 'm':
-                self.clear_screen()
-                self.draw_full_map()
-                input(f"\n{Fore.GREEN}Press Enter to continue...{Style.RESET_ALL}")
-            elif command == 'h':
-                self.show_help()
-            else:
-                self.last_action = f"{Fore.RED}Unknown command: {command}{Style.RESET_ALL}"
-        
         except RuntimeError as e:
             self.last_action = f"{Fore.RED}Error: {e}{Style.RESET_ALL}"
         
         return True
     
+    def _interact(self, dx: int, dy: int):
+        """Interact with the adjacent cell (doors) and resync the caches it may change."""
+        self.sim.interact(dx, dy)
+        self._refresh_layout()
+        self._rebuild_object_index()
+    
+    def _pick_up(self):
+        """Pick up the object at the agent's cell."""
+        self.sim.pick_up()
+        self._rebuild_object_index()
+        holding = self.sim.get_holding()
+        if holding:
+            self.last_action = f"{Fore.MAGENTA}Picked up: {holding.name}{Style.RESET_ALL}"
+    
+    def _drop(self):
+        """Drop the held object at the agent's cell."""
+        holding = self.sim.get_holding()
+        if holding:
+            self.sim.drop()
+            self._rebuild_object_index()
+            self.last_action = f"{Fore.MAGENTA}Dropped: {holding.name}{Style.RESET_ALL}"
+        else:
+            self.last_action = _NOT_HOLDING
+    
+    def _show_look(self):
+        """Show the detailed view until Enter is pressed."""
+        self.clear_screen()
+        self.show_inventory_and_nearby()
+        input(_PRESS_ENTER)
+    
+    def _show_map(self):
+        """Show the full map until Enter is pressed."""
+        self.clear_screen()
+        self.draw_full_map()
+        input(_PRESS_ENTER)
+    
     def handle_place_into(self):
         """Handle placing object into container with visual selection."""
         holding = self.sim.get_holding()
         if not holding:
-            self.last_action = f"{Fore.RED}Not holding anything{Style.RESET_ALL}"
+            self.last_action = _NOT_HOLDING
             return
         
-        objects_here = self.sim.get_objects_at(self.sim.agent_x, self.sim.agent_y)
+        objects_here = self._object_index.get((self.sim.agent_x, self.sim.agent_y), ())
         containers = [obj for obj in objects_here if obj.capacity > 0 and obj.id != holding.id]
         
         if not containers:
-            self.last_action = f"{Fore.RED}No containers here{Style.RESET_ALL}"
+            self.last_action = _NO_CONTAINERS
             return
         
         if len(containers) == 1:
@@ -361,14 +668,15 @@ class VisualSimulator:
                 if 0 <= idx < len(containers):
                     target = containers[idx]
                 else:
-                    self.last_action = f"{Fore.RED}Invalid choice{Style.RESET_ALL}"
+                    self.last_action = _INVALID_CHOICE
                     return
             except (ValueError, KeyboardInterrupt):
-                self.last_action = f"{Fore.RED}Cancelled{Style.RESET_ALL}"
+                self.last_action = _CANCELLED
                 return
         
         try:
             self.sim.place_into(target.id)
+            self._rebuild_object_index()
             self.last_action = f"{Fore.GREEN}Placed {holding.name} into {target.name}{Style.RESET_ALL}"
         except RuntimeError as e:
             self.last_action = f"{Fore.RED}Cannot place: {e}{Style.RESET_ALL}"
@@ -376,81 +684,97 @@ class VisualSimulator:
     def show_all_objects(self):
         """Show all objects grouped by room."""
         self.clear_screen()
+        buf = io.StringIO()
         objects = self.sim.get_objects()
-        print(f"{Fore.CYAN}ALL OBJECTS IN APARTMENT ({len(objects)} total){Style.RESET_ALL}")
-        print("="*50)
+        print(f"{Fore.CYAN}ALL OBJECTS IN APARTMENT ({len(objects)} total){Style.RESET_ALL}", file=buf)
+        print("="*50, file=buf)
         
-        # Group by room
+        # Group by room, reading each object's cell from the layout snapshot
+        cells = self._cells
+        width = self.layout.width
         rooms = {}
         for obj in objects:
-            cell_value = self.layout.get_cell(obj.x, obj.y)
-            if cell_value >= 0:
-                room_name = self.layout.get_room_name(cell_value)
-            else:
-                room_name = "Outside"
+            room_name = self._room_name(cells[obj.y * width + obj.x])
             
             if room_name not in rooms:
                 rooms[room_name] = []
             rooms[room_name].append(obj)
         
         for room_name, room_objects in rooms.items():
-            print(f"\n{Fore.YELLOW}🏠 {room_name}:{Style.RESET_ALL}")
+            print(f"\n{Fore.YELLOW}🏠 {room_name}:{Style.RESET_ALL}", file=buf)
             for obj in room_objects:
                 status = f"{Fore.MAGENTA}📦" if obj.pickable else f"{Fore.BLUE}🪑"
                 contents_info = f" ({len(obj.contents)} items)" if obj.contents else ""
-                print(f"  {status} {obj.name}{Style.RESET_ALL} at ({obj.x}, {obj.y}){contents_info}")
+                print(f"  {status} {obj.name}{Style.RESET_ALL} at ({obj.x}, {obj.y}){contents_info}", file=buf)
         
-        input(f"\n{Fore.GREEN}Press Enter to continue...{Style.RESET_ALL}")
+        sys.stdout.write(buf.getvalue())
+        
+        input(_PRESS_ENTER)
     
     def show_help(self):
         """Show help screen."""
         self.clear_screen()
-        print(f"{Fore.GREEN}{'='*50}{Style.RESET_ALL}")
-        print(f"{Fore.GREEN}HELP - Visual Apartment Simulator{Style.RESET_ALL}")
-        print(f"{Fore.GREEN}{'='*50}{Style.RESET_ALL}")
-        print(f"\n{Fore.YELLOW}MOVEMENT:{Style.RESET_ALL}")
-        print("  w, a, s, d - Move up, left, down, right")
-        print(f"\n{Fore.YELLOW}DOOR INTERACTION:{Style.RESET_ALL}")
-        print("  W, A, S, D - Open/close door up, left, down, right")
-        print(f"\n{Fore.YELLOW}OBJECT INTERACTION:{Style.RESET_ALL}")
-        print("  p - Pick up object at current location")
-        print("  r - Drop held object")
-        print("  i - Place held object into container")
-        print(f"\n{Fore.YELLOW}INFORMATION:{Style.RESET_ALL}")
-        print("  l - Look around (detailed view)")
-        print("  m - Show full map")
-        print("  o - List all objects")
-        print("  h - Show this help")
-        print(f"\n{Fore.YELLOW}GAME:{Style.RESET_ALL}")
-        print("  q - Quit")
-        print(f"\n{Fore.CYAN}The goal is to explore the apartment and interact with objects!")
-        print(f"Try picking up items and placing them in containers.{Style.RESET_ALL}")
-        
-        input(f"\n{Fore.GREEN}Press Enter to continue...{Style.RESET_ALL}")
+        buf = io.StringIO()
+        print(f"{Fore.GREEN}{'='*50}{Style.RESET_ALL}", file=buf)
+        print(f"{Fore.GREEN}HELP - Visual Apartment Simulator{Style.RESET_ALL}", file=buf)
+        print(f"{Fore.GREEN}{'='*50}{Style.RESET_ALL}", file=buf)
+        print(f"\n{Fore.YELLOW}MOVEMENT:{Style.RESET_ALL}", file=buf)
+        print("  w, a, s, d - Move up, left, down, right", file=buf)
+        print(f"\n{Fore.YELLOW}DOOR INTERACTION:{Style.RESET_ALL}", file=buf)
+        print("  W, A, S, D - Open/close door up, left, down, right", file=buf)
+        print(f"\n{Fore.YELLOW}OBJECT INTERACTION:{Style.RESET_ALL}", file=buf)
+        print("  p - Pick up object at current location", file=buf)
+        print("  r - Drop held object", file=buf)
+        print("  i - Place held object into container", file=buf)
+        print(f"\n{Fore.YELLOW}INFORMATION:{Style.RESET_ALL}", file=buf)
+        print("  l - Look around (detailed view)", file=buf)
+        print("  m - Show full map", file=buf)
+        print("  o - List all objects", file=buf)
+        print("  h - Show this help", file=buf)
+        print(f"\n{Fore.YELLOW}GAME:{Style.RESET_ALL}", file=buf)
+        print("  q - Quit", file=buf)
+        print(f"\n{Fore.CYAN}The goal is to explore the apartment and interact with objects!", file=buf)
+        print(f"Try picking up items and placing them in containers.{Style.RESET_ALL}", file=buf)
+        
+        sys.stdout.write(buf.getvalue())
+        
+        input(_PRESS_ENTER)
     
     def run(self):
-        """Run the visual simulation loop."""
-        self.refresh_display()
-        
-        while True:
-            try:
-                print(f"\n{Fore.GREEN}Command (h for help): {Style.RESET_ALL}", end="")
-                command = input().strip()
-                
-                if not command:
-                    continue
-                
-                if not self.handle_command(command):
+        """Run the visual simulation loop on the terminal's alternate screen.
+        
+        Like full-screen programs, the session leaves no scrollback behind;
+        the normal screen and the cursor come back however the loop ends.
+        """
+        # The map is redrawn in place, so hide the cursor while playing
+        sys.stdout.write("\x1b[?1049h\x1b[?25l")
+        farewell = False
+        try:
+            self.clear_screen()
+            self.show_welcome()
+            self.refresh_display()
+            
+            while True:
+                try:
+                    print(f"\n{Fore.GREEN}Command (h for help): {Style.RESET_ALL}", end="", flush=True)
+                    command = _getch().strip()
+                    
+                    if not command:
+                        continue
+                    
+                    if not self.handle_command(command):
+                        break
+                    
+                    self.refresh_display()
+                    
+                except (KeyboardInterrupt, EOFError):
+                    farewell = True
                     break
-                
-                self.refresh_display()
-                
-            except KeyboardInterrupt:
-                print(f"\n{Fore.YELLOW}Goodbye!{Style.RESET_ALL}")
-                break
-            except EOFError:
-                print(f"\n{Fore.YELLOW}Goodbye!{Style.RESET_ALL}")
-                break
+        finally:
+            _leave_alt_screen()
+        
+        if farewell:
+            print(f"\n{Fore.YELLOW}Goodbye!{Style.RESET_ALL}")
 
 
 def parse_args():